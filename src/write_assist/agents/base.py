@@ -3,25 +3,40 @@ Base agent class for orchestrating LLM calls.
 """
 
 import asyncio
-import json
 import logging
 import re
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Generic, TypeVar
+from typing import Any, ClassVar, Generic, TypeVar
 
+import pydantic_core
 from pydantic import BaseModel, ValidationError
 from tenacity import (
+    RetryCallState,
     before_sleep_log,
     retry,
     retry_if_exception_type,
+    retry_if_not_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_exponential_jitter,
 )
 
 from write_assist.agents.models import AgentError, ParallelRunResult, Provider
+from write_assist.agents.rate_limit import estimate_tokens, get_rate_limiter
 from write_assist.caching import get_llm_cache
-from write_assist.llm import LLMClient, LLMError, Message
+from write_assist.llm import (
+    AuthenticationError,
+    LLMClient,
+    LLMError,
+    Message,
+    RateLimitError,
+    UsageStats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +44,9 @@ logger = logging.getLogger(__name__)
 InputT = TypeVar("InputT", bound=BaseModel)
 OutputT = TypeVar("OutputT", bound=BaseModel)
 
+# Called as each provider finishes in run_parallel (result or AgentError)
+ResultCallback = Callable[[Provider, Any], None]
+
 # Default models per provider (premium models for write-assist)
 DEFAULT_MODELS: dict[Provider, str] = {
     "claude": "claude-opus-4-5-20251101",
@@ -36,6 +54,103 @@ DEFAULT_MODELS: dict[Provider, str] = {
     "chatgpt": "gpt-5.2",
 }
 
+# Jittered exponential backoff between attempts (4s, 8s, 16s, ... capped at 60s)
+_backoff = wait_exponential_jitter(initial=4, max=60, jitter=2)
+
+# Upper bound on how long a provider's Retry-After hint can make us wait
+MAX_RETRY_AFTER_SECONDS = 120.0
+
+
+def _retry_after_seconds(error: BaseException | None) -> float | None:
+    """Extract the Retry-After hint (in seconds) from a rate-limit error, if any."""
+    if not isinstance(error, RateLimitError):
+        return None
+    response = getattr(getattr(error, "original", None), "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _wait_before_retry(retry_state: RetryCallState) -> float:
+    """Back off with jitter, waiting at least as long as the provider asked."""
+    delay = _backoff(retry_state)
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = _retry_after_seconds(error)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, MAX_RETRY_AFTER_SECONDS))
+    return delay
+
+
+# LLM clients shared by every agent, one set per event loop. Connection pools
+# are bound to the loop that created them, so each loop gets its own clients.
+_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[Provider, str], LLMClient]
+] = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def get_llm_client(provider: Provider, model: str) -> LLMClient:
+    """
+    Get the shared LLM client for a provider/model pair.
+
+    Drafter, editor, and judge calls to the same provider all reuse one
+    client and its warm HTTP connection pool instead of each building
+    their own.
+    """
+    loop = asyncio.get_running_loop()
+    key = (provider, model)
+    with _clients_lock:
+        loop_clients = _clients.setdefault(loop, {})
+        client = loop_clients.get(key)
+        if client is None:
+            client = LLMClient(provider=provider, model=model if model else None)
+            loop_clients[key] = client
+    return client
+
+
+# In-flight requests by cache key, one table per event loop (see BaseAgent.run)
+_inflight: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Future[str]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_inflight() -> dict[str, asyncio.Future[str]]:
+    """Get the in-flight request table for the running event loop."""
+    return _inflight.setdefault(asyncio.get_running_loop(), {})
+
+
+@lru_cache(maxsize=32)
+def _read_spec(spec_path: Path) -> str:
+    """Read an agent spec once per process; specs don't change during a run."""
+    if not spec_path.exists():
+        raise FileNotFoundError(f"Agent spec not found: {spec_path}")
+    return spec_path.read_text()
+
+
+@dataclass(slots=True)
+class _RunRecord:
+    """Token usage and raw responses gathered over one run_parallel call."""
+
+    # Provider -> (tokens used, cached input tokens), including retries
+    token_usage: dict[Provider, tuple[int, int]] = field(default_factory=dict)
+    # Provider -> last raw LLM response
+    raw_responses: dict[Provider, str] = field(default_factory=dict)
+
+    def add_usage(self, provider: Provider, usage: UsageStats | None) -> None:
+        """Accumulate token usage for a provider, including provider-side cache hits."""
+        if usage is None:
+            return
+        used, cached = self.token_usage.get(provider, (0, 0))
+        self.token_usage[provider] = (
+            used + usage.total_tokens,
+            # Only reported when the provider surfaces prompt-cache reads
+            cached + (getattr(usage, "cached_input_tokens", 0) or 0),
+        )
+
 
 class BaseAgent(ABC, Generic[InputT, OutputT]):
     """
@@ -54,6 +169,17 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
     input_model: type[InputT]
     output_model: type[OutputT]
 
+    # Reuse the prompt across providers given the same inputs object. Only
+    # safe for agents whose build_prompt reads inputs that don't change mid-run.
+    memoize_prompt: ClassVar[bool] = False
+
+    # Exception type -> handler method, resolved along the exception's MRO
+    _ERROR_HANDLERS: ClassVar[dict[type[Exception], str]] = {
+        LLMError: "_llm_error",
+        ValueError: "_validation_error",
+        Exception: "_unexpected_error",
+    }
+
     def __init__(
         self,
         project_root: Path | None = None,
@@ -70,6 +196,10 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         self.models = models or DEFAULT_MODELS.copy()
         self._spec_content: str | None = None
         self._prompt_template: str | None = None
+        # Responses that failed validation in the last run_parallel to finish
+        self._failed_raw_responses: dict[Provider, str] = {}
+        # (inputs, prompt) for the last prompt built, when memoize_prompt is set
+        self._prompt_memo: tuple[InputT, str] | None = None
 
     def _find_project_root(self) -> Path:
         """Find the project root by looking for .claude directory."""
@@ -88,9 +218,7 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
     def load_spec(self) -> str:
         """Load the agent specification from markdown."""
         if self._spec_content is None:
-            if not self.spec_path.exists():
-                raise FileNotFoundError(f"Agent spec not found: {self.spec_path}")
-            self._spec_content = self.spec_path.read_text()
+            self._spec_content = _read_spec(self.spec_path)
         return self._spec_content
 
     def extract_prompt_template(self) -> str:
@@ -118,13 +246,25 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         """
         pass
 
-    def parse_json_response(self, response: str, provider: Provider) -> OutputT:
+    def validation_context(self, inputs: InputT) -> dict[str, Any] | None:
+        """
+        Context passed to output validation for responses to these inputs.
+
+        Subclasses override this when an output is only valid relative to
+        what was asked, e.g. the judge must rank every draft it was given.
+        By default outputs are validated on their own.
+        """
+
+    def parse_json_response(
+        self, response: str, provider: Provider, inputs: InputT | None = None
+    ) -> OutputT:
         """
         Parse JSON from LLM response and validate against output model.
 
         Args:
             response: Raw response text from LLM
             provider: Which provider generated this response
+            inputs: The inputs the response answers, for validation_context
 
         Returns:
             Validated output model instance
@@ -132,10 +272,6 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         Raises:
             ValueError: If JSON parsing or validation fails
         """
-        # Store raw response for debugging
-        self._last_raw_response = response
-        self._last_provider = provider
-
         # Try to extract JSON from the response
         # LLMs sometimes wrap JSON in markdown code blocks
         json_str = response.strip()
@@ -160,8 +296,9 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
                 json_str = match.group(0)
 
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as e:
+            # pydantic-core's native parser; much faster than json.loads on large drafts
+            data = pydantic_core.from_json(json_str)
+        except ValueError as e:
             # Log the full response for debugging
             logger.error(
                 f"JSON parse error from {provider}:\n"
@@ -183,7 +320,8 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         data["metadata"]["provider"] = provider
 
         try:
-            return self.output_model.model_validate(data)
+            context = self.validation_context(inputs) if inputs is not None else None
+            return self.output_model.model_validate(data, context=context)
         except ValidationError as e:
             # Log validation errors with context
             logger.error(
@@ -222,12 +360,24 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
             LLMError: If the LLM call fails after all retries
             ValueError: If output parsing/validation fails after all retries
         """
+        return await self._run(inputs, provider, max_tokens, temperature, max_retries, _RunRecord())
+
+    async def _run(
+        self,
+        inputs: InputT,
+        provider: Provider,
+        max_tokens: int,
+        temperature: float,
+        max_retries: int,
+        record: _RunRecord,
+    ) -> OutputT:
+        """Run on one provider, adding its usage and raw responses to record."""
         # Validate inputs
         if not isinstance(inputs, self.input_model):
             inputs = self.input_model.model_validate(inputs)
 
         # Build prompt
-        prompt = self.build_prompt(inputs)
+        prompt = self._get_prompt(inputs)
         system_message = self._get_system_message()
 
         # Get model for this provider
@@ -247,41 +397,96 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         cached_response = cache.get(cache_key)
         if cached_response is not None:
             # Return cached response
-            return self.parse_json_response(cached_response, provider)
+            record.raw_responses[provider] = cached_response
+            return self.parse_json_response(cached_response, provider, inputs)
+
+        # Reuse one client (and its connection pool) across all attempts
+        client = get_llm_client(provider, model)
+
+        # Throttle client-side against the provider's shared request/token budget
+        limiter = get_rate_limiter(provider)
+        # Only a token budget uses the estimate; don't tokenize the prompt without one
+        estimated_tokens = (
+            estimate_tokens(system_message, prompt) + max_tokens if limiter.tokens_per_minute else 0
+        )
+
+        # Build the conversation once; every attempt sends the same messages
+        messages = [
+            Message(role="system", content=system_message),
+            Message(role="user", content=prompt),
+        ]
 
         # Define the retryable operation
         @retry(
             stop=stop_after_attempt(max_retries),
-            wait=wait_exponential(multiplier=2, min=4, max=60),
-            retry=retry_if_exception_type((LLMError, ValueError, TimeoutError)),
+            wait=_wait_before_retry,
+            # Bad credentials won't fix themselves; everything else may be transient
+            retry=retry_if_exception_type((LLMError, ValueError, TimeoutError))
+            & retry_if_not_exception_type(AuthenticationError),
             before_sleep=before_sleep_log(logger, logging.WARNING),
             reraise=True,
         )
-        async def _call_with_retry() -> str:
+        async def _call_with_retry() -> tuple[OutputT, str]:
             """Make LLM call with retry logic."""
-            client = LLMClient(provider=provider, model=model if model else None)
-
             logger.info(f"Calling {provider} ({model or 'default'}) for {self.agent_name}")
 
-            response = await client.chat(
-                messages=[
-                    Message(role="system", content=system_message),
-                    Message(role="user", content=prompt),
-                ],
-                max_tokens=max_tokens,
-                temperature=temperature,
-            )
+            await limiter.acquire(estimated_tokens)
+            throttled = False
+            try:
+                response = await client.chat(
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                )
+            except RateLimitError:
+                throttled = True
+                raise
+            finally:
+                await limiter.release(throttled=throttled)
+
+            record.add_usage(provider, response.usage)
 
             # Try to parse immediately to catch format errors
             # This allows retry on malformed responses
-            parsed = self.parse_json_response(response.content, provider)
+            record.raw_responses[provider] = response.content
+            parsed = self.parse_json_response(response.content, provider, inputs)
 
             # Only cache if parsing succeeded
             cache.set(cache_key, response.content)
 
-            return parsed
+            return parsed, response.content
 
-        return await _call_with_retry()
+        # Coalesce identical concurrent requests into a single provider call
+        inflight = _get_inflight()
+        pending = inflight.get(cache_key)
+        if pending is not None:
+            logger.info(f"Joining in-flight {provider} request for {self.agent_name}")
+            try:
+                content = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The original caller was cancelled; make our own request
+            else:
+                record.raw_responses[provider] = content
+                return self.parse_json_response(content, provider, inputs)
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        inflight[cache_key] = future
+        try:
+            parsed, content = await _call_with_retry()
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; only joined callers need to see it
+            raise
+        else:
+            future.set_result(content)
+            return parsed
+        finally:
+            if not future.done():
+                future.cancel()
+            if inflight.get(cache_key) is future:
+                del inflight[cache_key]
 
     async def run_parallel(
         self,
@@ -290,6 +495,10 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         max_tokens: int = 8192,
         temperature: float = 0.7,
         max_retries: int = 3,
+        on_result: ResultCallback | None = None,
+        max_concurrency: int | None = None,
+        quorum: int | None = None,
+        straggler_timeout: float | None = None,
     ) -> ParallelRunResult:
         """
         Run the agent on multiple providers in parallel.
@@ -300,6 +509,13 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature
             max_retries: Maximum retry attempts per provider
+            on_result: Optional callback invoked as each provider finishes,
+                so callers can report results without waiting for the slowest
+            max_concurrency: Maximum provider calls in flight at once (default: all)
+            quorum: Return once this many providers have succeeded instead of
+                waiting for all of them (default: wait for all)
+            straggler_timeout: With a quorum, seconds to keep waiting for the
+                remaining providers before cancelling them (default: don't wait)
 
         Returns:
             ParallelRunResult with successful and failed results
@@ -311,59 +527,55 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         if not isinstance(inputs, self.input_model):
             inputs = self.input_model.model_validate(inputs)
 
-        # Store raw responses for failed providers (for debugging)
-        self._failed_raw_responses: dict[Provider, str] = {}
+        # Usage and raw responses for this call only; overlapping calls keep their own
+        record = _RunRecord()
+        failed_raw_responses: dict[Provider, str] = {}
+
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
 
         async def run_one(provider: Provider) -> tuple[Provider, OutputT | AgentError]:
+            """Run on one provider and report the outcome as soon as it is known."""
+            if semaphore:
+                async with semaphore:
+                    outcome = await attempt(provider)
+            else:
+                outcome = await attempt(provider)
+            self._report_result(on_result, *outcome)
+            return outcome
+
+        async def attempt(provider: Provider) -> tuple[Provider, OutputT | AgentError]:
             """Run on one provider, catching errors."""
             try:
-                result = await self.run(
-                    inputs=inputs,
-                    provider=provider,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    max_retries=max_retries,
+                result = await self._run(
+                    inputs, provider, max_tokens, temperature, max_retries, record
                 )
                 return provider, result
-            except LLMError as e:
-                logger.error(f"{self.agent_name} LLM error from {provider}: {e}")
-                return provider, AgentError(
-                    provider=provider,
-                    error_type=type(e).__name__,
-                    message=str(e),
-                    original_error=str(e.original)
-                    if hasattr(e, "original") and e.original
-                    else None,
-                )
-            except ValueError as e:
-                # Capture raw response if available
-                if (
-                    hasattr(self, "_last_raw_response")
-                    and hasattr(self, "_last_provider")
-                    and self._last_provider == provider
-                ):
-                    self._failed_raw_responses[provider] = self._last_raw_response
+            except Exception as e:
+                error = self._to_agent_error(provider, e)
+                raw = record.raw_responses.get(provider)
+                if error.error_type == "ValidationError" and raw is not None:
+                    # Keep what the provider actually returned, for debugging
+                    failed_raw_responses[provider] = raw
                     logger.error(
-                        f"{self.agent_name} validation error from {provider}. "
-                        f"Raw response saved ({len(self._last_raw_response)} chars)"
+                        f"{self.agent_name} raw response from {provider} saved ({len(raw)} chars)"
                     )
-                return provider, AgentError(
-                    provider=provider,
-                    error_type="ValidationError",
-                    message=str(e),
-                )
-            except Exception as e:
-                logger.error(
-                    f"{self.agent_name} unexpected error from {provider}: {type(e).__name__}: {e}"
-                )
-                return provider, AgentError(
-                    provider=provider,
-                    error_type=type(e).__name__,
-                    message=str(e),
-                )
-
-        # Run all in parallel
-        results = await asyncio.gather(*[run_one(p) for p in providers])
+                return provider, error
+
+        # Run all in parallel. If the caller gives up, provider calls still in
+        # flight are cancelled and awaited so none finishes (and bills) later
+        if quorum is None:
+            async with asyncio.TaskGroup() as group:
+                running = [group.create_task(run_one(p)) for p in providers]
+            results = [task.result() for task in running]
+        else:
+            tasks = {asyncio.create_task(run_one(p)): p for p in providers}
+            try:
+                results = await self._wait_for_quorum(tasks, quorum, straggler_timeout, on_result)
+            except asyncio.CancelledError:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
 
         # Separate successes and failures
         successful: dict[Provider, OutputT] = {}
@@ -375,13 +587,125 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
             else:
                 successful[provider] = result
 
-        return ParallelRunResult(successful=successful, failed=failed)
+        self._failed_raw_responses = failed_raw_responses
+        return ParallelRunResult(
+            successful=successful,
+            failed=failed,
+            tokens_used=sum(used for used, _ in record.token_usage.values()),
+            cached_tokens=sum(cached for _, cached in record.token_usage.values()),
+            failed_raw_responses=failed_raw_responses,
+        )
+
+    async def _wait_for_quorum(
+        self,
+        tasks: dict[asyncio.Task, Provider],
+        quorum: int,
+        straggler_timeout: float | None,
+        on_result: ResultCallback | None,
+    ) -> list[tuple[Provider, OutputT | AgentError]]:
+        """
+        Wait until `quorum` providers succeed, then give stragglers a grace period.
+
+        Providers still running after the grace period are cancelled and
+        reported as failed, so the next phase isn't held up by the slowest one.
+        """
+        pending = set(tasks)
+        succeeded = 0
+        while pending and succeeded < quorum:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            succeeded += sum(not isinstance(task.result()[1], AgentError) for task in done)
+
+        if pending and straggler_timeout:
+            _, pending = await asyncio.wait(pending, timeout=straggler_timeout)
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        results: list[tuple[Provider, OutputT | AgentError]] = []
+        for task, provider in tasks.items():
+            if not task.cancelled():
+                results.append(task.result())
+                continue
+            error = AgentError(
+                provider=provider,
+                error_type="TimeoutError",
+                message=f"Cancelled after a quorum of {quorum} providers succeeded",
+            )
+            self._report_result(on_result, provider, error)
+            results.append((provider, error))
+
+        return results
+
+    def _report_result(
+        self, on_result: ResultCallback | None, provider: Provider, result: Any
+    ) -> None:
+        """Call on_result, logging failures so a listener bug can't abort provider calls."""
+        if on_result is None:
+            return
+        try:
+            on_result(provider, result)
+        except Exception as e:
+            logger.warning(f"{self.agent_name} result callback failed for {provider}: {e}")
+
+    def _to_agent_error(self, provider: Provider, error: Exception) -> AgentError:
+        """Translate an exception from a provider run using the most specific handler."""
+        for error_type in type(error).__mro__:
+            handler_name = self._ERROR_HANDLERS.get(error_type)
+            if handler_name:
+                return getattr(self, handler_name)(provider, error)
+        return self._unexpected_error(provider, error)
+
+    def _llm_error(self, provider: Provider, error: LLMError) -> AgentError:
+        """Map an LLM client error (auth, rate limit, API failure)."""
+        logger.error(f"{self.agent_name} LLM error from {provider}: {error}")
+        original = getattr(error, "original", None)
+        return AgentError(
+            provider=provider,
+            error_type=type(error).__name__,
+            message=str(error),
+            original_error=str(original) if original else None,
+        )
+
+    def _validation_error(self, provider: Provider, error: ValueError) -> AgentError:
+        """Map a JSON parse/validation failure."""
+        logger.error(f"{self.agent_name} validation error from {provider}")
+        return AgentError(
+            provider=provider,
+            error_type="ValidationError",
+            message=str(error),
+        )
+
+    def _unexpected_error(self, provider: Provider, error: Exception) -> AgentError:
+        """Map any other exception."""
+        logger.error(
+            f"{self.agent_name} unexpected error from {provider}: {type(error).__name__}: {error}"
+        )
+        return AgentError(
+            provider=provider,
+            error_type=type(error).__name__,
+            message=str(error),
+        )
+
+    def _get_prompt(self, inputs: InputT) -> str:
+        """Build the prompt, reusing the last one if inputs is the same object."""
+        if not self.memoize_prompt:
+            return self.build_prompt(inputs)
+        memo = self._prompt_memo
+        if memo is not None and memo[0] is inputs:
+            return memo[1]
+        prompt = self.build_prompt(inputs)
+        self._prompt_memo = (inputs, prompt)
+        return prompt
 
     def get_failed_raw_response(self, provider: Provider) -> str | None:
-        """Get the raw response from a failed provider for debugging."""
-        if hasattr(self, "_failed_raw_responses"):
-            return self._failed_raw_responses.get(provider)
-        return None
+        """
+        Get the raw response from a failed provider for debugging.
+
+        Reflects the last run_parallel call to finish; with overlapping calls,
+        read ParallelRunResult.failed_raw_responses instead.
+        """
+        return self._failed_raw_responses.get(provider)
 
     def _get_system_message(self) -> str:
         """Get the system message for this agent."""
@@ -4,7 +4,10 @@ Drafter agent implementation.
 Creates initial drafts of legal academic writing with research and citations.
 """
 
-from write_assist.agents.base import BaseAgent
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from write_assist.agents.base import BaseAgent, get_llm_client
 from write_assist.agents.models import (
     DrafterInput,
     DraftResult,
@@ -13,6 +16,10 @@ from write_assist.agents.models import (
     Provider,
 )
 
+if TYPE_CHECKING:
+    from write_assist.llm import LLMClient
+    from write_assist.tools.search import SearchTool
+
 
 class DrafterAgent(BaseAgent[DrafterInput, DraftResult]):
     """
@@ -30,11 +37,31 @@ class DrafterAgent(BaseAgent[DrafterInput, DraftResult]):
     input_model = DrafterInput
     output_model = DraftResult
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        from write_assist.tools.search import SearchTool
+    def __init__(
+        self,
+        project_root: Path | None = None,
+        models: dict[Provider, str] | None = None,
+        *,
+        search_tool: "SearchTool | None" = None,
+        llm_clients: "dict[Provider, LLMClient] | None" = None,
+    ):
+        """
+        Initialize the drafter.
+
+        Args:
+            project_root: Root directory of the project (for finding specs)
+            models: Custom models per provider (overrides defaults)
+            search_tool: Search tool for the research loop (default: SearchTool())
+            llm_clients: Research-loop client for each provider; providers not
+                listed use the shared per-loop client
+        """
+        super().__init__(project_root, models)
+        if search_tool is None:
+            from write_assist.tools.search import SearchTool
 
-        self.search_tool = SearchTool()
+            search_tool = SearchTool()
+        self.search_tool = search_tool
+        self.llm_clients = llm_clients or {}
 
     def build_prompt(self, inputs: DrafterInput) -> str:
         """Build the drafter prompt from inputs."""
@@ -188,7 +215,7 @@ Now create the draft. Respond ONLY with the JSON object."""
         import logging
         import re
 
-        from write_assist.llm import LLMClient, Message
+        from write_assist.llm import Message
 
         logger = logging.getLogger(__name__)
         logger.info(
@@ -212,7 +239,9 @@ Now create the draft. Respond ONLY with the JSON object."""
         ]
 
         steps_taken = 0
-        client = LLMClient(provider=provider, model=self.models.get(provider))
+        client = self.llm_clients.get(provider) or get_llm_client(
+            provider, self.models.get(provider) or ""
+        )
 
         while steps_taken < inputs.max_research_steps:
             try:
@@ -241,8 +270,8 @@ Now create the draft. Respond ONLY with the JSON object."""
                         query = query_match.group(1)
                         logger.info(f"Executing search: {query}")
 
-                        # Execute tool
-                        result = self.search_tool.run(query=query)
+                        # Execute tool without blocking the other providers' loops
+                        result = await self.search_tool.run_async(query=query)
 
                         # Add interaction to history
                         history.append(Message(role="assistant", content=content))
@@ -7,6 +7,9 @@ Integrates multiple drafts into a single superior version.
 from write_assist.agents.base import BaseAgent
 from write_assist.agents.models import EditorInput, EditResult
 
+# Spelled-out draft counts for the prompt
+DRAFT_COUNT_LABELS = {1: "ONE draft", 2: "TWO drafts", 3: "THREE drafts"}
+
 
 class EditorAgent(BaseAgent[EditorInput, EditResult]):
     """
@@ -25,14 +28,14 @@ class EditorAgent(BaseAgent[EditorInput, EditResult]):
     spec_file = "editor-agent.md"
     input_model = EditorInput
     output_model = EditResult
+    memoize_prompt = True
 
     def build_prompt(self, inputs: EditorInput) -> str:
         """Build the editor prompt from inputs."""
-        # Format the three drafts
+        # Format the drafts, labelled by the provider that wrote each one
         draft_sections = []
-        provider_order = ["claude", "gemini", "chatgpt"]
 
-        for i, (provider, draft) in enumerate(zip(provider_order, inputs.drafts)):
+        for i, (provider, draft) in enumerate(zip(inputs.providers, inputs.drafts)):
             section = f"""### Draft {chr(65 + i)} ({provider.title()})
 
 **Title:** {draft.draft.title}
@@ -54,6 +57,8 @@ class EditorAgent(BaseAgent[EditorInput, EditResult]):
             draft_sections.append(section)
 
         drafts_str = "\n\n".join(draft_sections)
+        draft_count = len(inputs.drafts)
+        drafts_label = DRAFT_COUNT_LABELS.get(draft_count, f"{draft_count} drafts")
 
         # Format focus areas
         focus_areas_str = (
@@ -66,7 +71,7 @@ class EditorAgent(BaseAgent[EditorInput, EditResult]):
 
 ## Your Task
 
-You have received THREE drafts on the same topic from different AI models. Your job is to:
+You have received {drafts_label} on the same topic from different AI models. Your job is to:
 1. Analyze each draft's strengths and weaknesses
 2. Synthesize the best elements into one cohesive draft
 3. Ensure consistent voice and style throughout
@@ -79,7 +84,7 @@ You have received THREE drafts on the same topic from different AI models. Your
 **Document Type:** {inputs.original_context.document_type}
 **Original Outline:** {inputs.original_context.section_outline}
 
-## The Three Drafts
+## The Drafts
 
 {drafts_str}
 
@@ -4,9 +4,25 @@ Judge agent implementation.
 Evaluates and ranks integrated drafts with detailed explanations.
 """
 
+from typing import Any
+
 from write_assist.agents.base import BaseAgent
 from write_assist.agents.models import JudgeInput, JudgeResult
 
+# Spelled-out draft counts for the prompt
+DRAFT_COUNT_LABELS = {
+    1: "one integrated draft",
+    2: "two integrated drafts",
+    3: "three integrated drafts",
+}
+
+# Example ranking entries for the output format, best first
+PLACE_EXAMPLES = [
+    ("first_place", 8.5, "One-paragraph summary of why this draft ranks first"),
+    ("second_place", 7.8, "One-paragraph summary of ranking rationale"),
+    ("third_place", 7.2, "One-paragraph summary of ranking rationale"),
+]
+
 
 class JudgeAgent(BaseAgent[JudgeInput, JudgeResult]):
     """
@@ -25,14 +41,19 @@ class JudgeAgent(BaseAgent[JudgeInput, JudgeResult]):
     spec_file = "judge-agent.md"
     input_model = JudgeInput
     output_model = JudgeResult
+    memoize_prompt = True
+
+    def validation_context(self, inputs: JudgeInput) -> dict[str, Any]:
+        """Reject judgments that skip a place or score set for a judged draft."""
+        return {"judged_providers": inputs.providers}
 
     def build_prompt(self, inputs: JudgeInput) -> str:
         """Build the judge prompt from inputs."""
-        # Format the three integrated drafts
+        # Format the integrated drafts, labelled by the provider that edited each one
         draft_sections = []
-        provider_order = ["claude", "gemini", "chatgpt"]
+        providers = inputs.providers
 
-        for i, (provider, edit) in enumerate(zip(provider_order, inputs.integrated_drafts)):
+        for i, (provider, edit) in enumerate(zip(providers, inputs.integrated_drafts)):
             section = f"""### Integrated Draft {chr(88 + i)} (from {provider.title()} Editor)
 
 **Title:** {edit.integrated_draft.title}
@@ -58,6 +79,9 @@ class JudgeAgent(BaseAgent[JudgeInput, JudgeResult]):
             draft_sections.append(section)
 
         drafts_str = "\n\n".join(draft_sections)
+        draft_count = len(providers)
+        drafts_label = DRAFT_COUNT_LABELS.get(draft_count, f"{draft_count} integrated drafts")
+        rankings_example, scores_example = self._format_output_examples(providers)
 
         # Format weights
         weights = inputs.priority_weights or {
@@ -79,7 +103,7 @@ class JudgeAgent(BaseAgent[JudgeInput, JudgeResult]):
             else "None specified - apply standard evaluation"
         )
 
-        return f"""You are an expert evaluator of legal academic writing, tasked with ranking three integrated drafts.
+        return f"""You are an expert evaluator of legal academic writing, tasked with ranking {drafts_label}.
 
 ## Your Role
 
@@ -95,7 +119,7 @@ You are one of THREE judges evaluating these drafts. A human will review all thr
 **Document Type:** {inputs.original_context.document_type}
 **Requirements:** {inputs.original_context.section_outline}
 
-## The Three Integrated Drafts
+## The Integrated Drafts
 
 {drafts_str}
 
@@ -153,33 +177,10 @@ Return a JSON object with this exact structure:
 ```json
 {{
   "rankings": {{
-    "first_place": {{
-      "draft_source": "claude | gemini | chatgpt",
-      "overall_score": 8.5,
-      "summary": "One-paragraph summary of why this draft ranks first"
-    }},
-    "second_place": {{
-      "draft_source": "claude | gemini | chatgpt",
-      "overall_score": 7.8,
-      "summary": "One-paragraph summary of ranking rationale"
-    }},
-    "third_place": {{
-      "draft_source": "claude | gemini | chatgpt",
-      "overall_score": 7.2,
-      "summary": "One-paragraph summary of ranking rationale"
-    }}
+{rankings_example}
   }},
   "detailed_scores": {{
-    "claude_edit": {{
-      "argument_strength": {{"score": 8, "explanation": "..."}},
-      "citation_quality": {{"score": 9, "explanation": "..."}},
-      "prose_clarity": {{"score": 8, "explanation": "..."}},
-      "structural_coherence": {{"score": 7, "explanation": "..."}},
-      "academic_rigor": {{"score": 8, "explanation": "..."}},
-      "originality": {{"score": 7, "explanation": "..."}}
-    }},
-    "gemini_edit": {{ ... same structure ... }},
-    "chatgpt_edit": {{ ... same structure ... }}
+{scores_example}
   }},
   "comparative_analysis": {{
     "strongest_arguments": "Which draft had the most compelling arguments and why",
@@ -203,3 +204,32 @@ Return a JSON object with this exact structure:
 Remember: A human will compare your rankings with two other judges. Provide the reasoning they need to make an informed final decision.
 
 Now evaluate and rank the drafts. Respond ONLY with the JSON object."""
+
+    @staticmethod
+    def _format_output_examples(providers: list[str]) -> tuple[str, str]:
+        """Format the rankings and detailed_scores examples for the judged providers."""
+        sources = " | ".join(providers)
+        rankings = ",\n".join(
+            f"""    "{place}": {{
+      "draft_source": "{sources}",
+      "overall_score": {score},
+      "summary": "{summary}"
+    }}"""
+            for place, score, summary in PLACE_EXAMPLES[: len(providers)]
+        )
+
+        scores = [
+            f"""    "{providers[0]}_edit": {{
+      "argument_strength": {{"score": 8, "explanation": "..."}},
+      "citation_quality": {{"score": 9, "explanation": "..."}},
+      "prose_clarity": {{"score": 8, "explanation": "..."}},
+      "structural_coherence": {{"score": 7, "explanation": "..."}},
+      "academic_rigor": {{"score": 8, "explanation": "..."}},
+      "originality": {{"score": 7, "explanation": "..."}}
+    }}"""
+        ]
+        scores += [
+            f'    "{provider}_edit": {{ ... same structure ... }}' for provider in providers[1:]
+        ]
+
+        return rankings, ",\n".join(scores)
@@ -5,14 +5,23 @@ These models match the contracts defined in .claude/agents/*.md
 """
 
 from datetime import datetime
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationInfo, model_validator
+
+if TYPE_CHECKING:
+    from write_assist.citations.models import CitationResult
 
 Provider = Literal["claude", "gemini", "chatgpt"]
 DocumentType = Literal["article", "casebook_section"]
 
 
+def _check_one_provider_each(providers: list[Provider], items: list[Any]) -> None:
+    """Raise ValueError unless providers label the items one-to-one."""
+    if len(providers) != len(items) or len(set(providers)) != len(providers):
+        raise ValueError(f"expected one distinct provider per draft, got {providers}")
+
+
 # =============================================================================
 # Common Models
 # =============================================================================
@@ -53,6 +62,26 @@ class LocalCitation(BaseModel):
     relevance_score: float
     relevant_text: str  # Chunk or summary from cite-assist
 
+    @classmethod
+    def from_api_result(cls, result: "CitationResult") -> Self:
+        """
+        Build from a cite-assist search result.
+
+        The result was validated when the response was parsed, so its fields
+        are copied across without validating them a second time.
+        """
+        return cls.model_construct(
+            id=result.id,
+            title=result.title,
+            authors=result.authors,
+            year=result.year,
+            journal=result.journal,
+            volume=result.volume,
+            pages=result.pages,
+            relevance_score=result.score,
+            relevant_text=result.relevant_text,
+        )
+
 
 class LoadedSource(BaseModel):
     """A loaded source document with content."""
@@ -127,11 +156,22 @@ class DraftResult(BaseModel):
 class EditorInput(BaseModel):
     """Input contract for the editor agent."""
 
-    drafts: list[DraftResult]  # Expects 3 drafts from different providers
+    drafts: list[DraftResult]  # One draft per provider that succeeded (up to 3)
+    # Provider that wrote each draft, in order. The pipeline passes its own
+    # keys; when omitted, falls back to each draft's reported metadata
+    providers: list[Provider] = Field(default_factory=list)
     original_context: DrafterInput
     focus_areas: list[str] = Field(default_factory=list)
     style_preference: str | None = None
 
+    @model_validator(mode="after")
+    def _one_provider_per_draft(self) -> Self:
+        """Fill in missing provider labels, then require one distinct label per draft."""
+        if not self.providers:
+            self.providers = [draft.metadata.provider for draft in self.drafts]
+        _check_one_provider_each(self.providers, self.drafts)
+        return self
+
 
 class IntegratedDraft(BaseModel):
     """The integrated draft produced by the editor."""
@@ -178,12 +218,23 @@ class EditResult(BaseModel):
 class JudgeInput(BaseModel):
     """Input contract for the judge agent."""
 
-    integrated_drafts: list[EditResult]  # Expects 3 edits from different providers
+    integrated_drafts: list[EditResult]  # One edit per provider that succeeded (up to 3)
+    # Provider that edited each draft, in order. The pipeline passes its own
+    # keys; when omitted, falls back to each edit's reported metadata
+    providers: list[Provider] = Field(default_factory=list)
     original_context: DrafterInput
     evaluation_criteria: dict[str, float] | None = None  # Custom weights
     priority_weights: dict[str, float] | None = None
     specific_concerns: list[str] = Field(default_factory=list)
 
+    @model_validator(mode="after")
+    def _one_provider_per_draft(self) -> Self:
+        """Fill in missing provider labels, then require one distinct label per draft."""
+        if not self.providers:
+            self.providers = [edit.metadata.provider for edit in self.integrated_drafts]
+        _check_one_provider_each(self.providers, self.integrated_drafts)
+        return self
+
 
 class RankingEntry(BaseModel):
     """A single ranking entry."""
@@ -197,8 +248,17 @@ class Rankings(BaseModel):
     """Rankings from the judge."""
 
     first_place: RankingEntry
-    second_place: RankingEntry
-    third_place: RankingEntry
+    # Absent when fewer drafts were judged
+    second_place: RankingEntry | None = None
+    third_place: RankingEntry | None = None
+
+    def places(self) -> list[RankingEntry]:
+        """Get the ranking entries that are present, best first."""
+        return [
+            entry
+            for entry in (self.first_place, self.second_place, self.third_place)
+            if entry is not None
+        ]
 
 
 class ScoreExplanation(BaseModel):
@@ -220,11 +280,11 @@ class DetailedScore(BaseModel):
 
 
 class DetailedScores(BaseModel):
-    """Detailed scores for all three drafts."""
+    """Detailed scores for each judged draft."""
 
-    claude_edit: DetailedScore
-    gemini_edit: DetailedScore
-    chatgpt_edit: DetailedScore
+    claude_edit: DetailedScore | None = None
+    gemini_edit: DetailedScore | None = None
+    chatgpt_edit: DetailedScore | None = None
 
 
 class ComparativeAnalysis(BaseModel):
@@ -253,6 +313,27 @@ class JudgeResult(BaseModel):
     recommendations: Recommendations
     metadata: AgentMetadata
 
+    @model_validator(mode="after")
+    def _covers_judged_providers(self, info: ValidationInfo) -> Self:
+        """
+        Require one place and one score set per judged draft.
+
+        Only enforced when validation is given the judged providers (as
+        ``judged_providers`` in the context); stored judgments load as-is.
+        """
+        judged = (info.context or {}).get("judged_providers")
+        if judged is None:
+            return self
+
+        ranked = [entry.draft_source for entry in self.rankings.places()]
+        if sorted(ranked) != sorted(judged):
+            raise ValueError(f"rankings must place each of {list(judged)} once, got {ranked}")
+
+        unscored = [p for p in judged if getattr(self.detailed_scores, f"{p}_edit") is None]
+        if unscored:
+            raise ValueError(f"detailed_scores missing for {unscored}")
+        return self
+
 
 # =============================================================================
 # Agent Run Results (with error handling)
@@ -273,6 +354,10 @@ class ParallelRunResult(BaseModel):
 
     successful: dict[Provider, Any]  # Provider -> result (type depends on agent)
     failed: dict[Provider, AgentError]
+    tokens_used: int = 0  # Billed tokens across all providers (including retries)
+    cached_tokens: int = 0  # Input tokens served from provider-side prompt caches
+    # Raw LLM output for providers whose response failed validation (for debugging)
+    failed_raw_responses: dict[Provider, str] = Field(default_factory=dict)
 
     @property
     def all_succeeded(self) -> bool:
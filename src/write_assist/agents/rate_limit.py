@@ -0,0 +1,241 @@
+"""
+Client-side rate limiting for provider calls.
+
+Combines an AIMD (additive-increase / multiplicative-decrease) concurrency
+limit with sliding-window request and token budgets, so the pipeline backs
+off before it trips a provider's rate limit rather than after.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from functools import lru_cache
+from typing import Any
+
+from write_assist.agents.models import Provider
+
+logger = logging.getLogger(__name__)
+
+# Default ceiling on concurrent requests per provider
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Per-provider ceilings, sized to each provider's typical rate-limit tier.
+# Override with WRITE_ASSIST_MAX_CONCURRENCY_<PROVIDER>, e.g. ..._GEMINI=4
+PROVIDER_MAX_CONCURRENCY: dict[Provider, int] = {
+    "claude": 4,
+    "gemini": 2,
+    "chatgpt": 8,
+}
+
+# Sliding window for request/token budgets, in seconds. Budgets are off by
+# default; set WRITE_ASSIST_RPM_<PROVIDER> / WRITE_ASSIST_TPM_<PROVIDER> to the
+# account's per-minute limits, e.g. WRITE_ASSIST_TPM_CLAUDE=40000
+WINDOW_SECONDS = 60.0
+
+# AIMD tuning: halve on throttling, grow by half a slot per success
+DECREASE_FACTOR = 0.5
+INCREASE_STEP = 0.5
+
+# Fallback heuristic when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+# Per-message framing overhead (role markers, separators)
+TOKENS_PER_MESSAGE = 4
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> Any | None:
+    """Load a tiktoken encoding once, if tiktoken is installed and usable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        # Provider-neutral approximation; Claude and Gemini tokenize similarly
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encoding files are fetched on first use and may be unavailable offline
+        return None
+
+
+def estimate_tokens(*texts: str) -> int:
+    """
+    Estimate the prompt tokens for a set of message contents.
+
+    Uses tiktoken when installed, falling back to ~4 characters per token.
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        content_tokens = sum(len(text) for text in texts) // CHARS_PER_TOKEN
+    else:
+        content_tokens = sum(len(encoding.encode(text, disallowed_special=())) for text in texts)
+    return content_tokens + TOKENS_PER_MESSAGE * len(texts)
+
+
+class RateLimiter:
+    """
+    AIMD concurrency controller with sliding-window RPM/TPM budgets.
+
+    Usage:
+        await limiter.acquire(estimated_tokens=2000)
+        try:
+            response = await client.chat(...)
+        finally:
+            await limiter.release(throttled=...)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrency: Upper bound on concurrent requests
+            requests_per_minute: Request budget per sliding window (None = unlimited)
+            tokens_per_minute: Token budget per sliding window (None = unlimited)
+        """
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.concurrency = float(max_concurrency)
+        self._in_flight = 0
+        self._requests: deque[float] = deque()
+        self._tokens: deque[tuple[float, int]] = deque()
+        self._window_tokens = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    async def acquire(self, estimated_tokens: int = 0) -> None:
+        """
+        Wait for a concurrency slot and room in the request/token budgets.
+
+        Args:
+            estimated_tokens: Expected prompt + completion tokens for the request
+        """
+        async with self._condition:
+            while True:
+                delay = self._budget_delay(estimated_tokens)
+                if delay <= 0 and self._in_flight < max(1, int(self.concurrency)):
+                    break
+                if delay > 0:
+                    # Budget frees up as the window slides; wake early on release
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._condition.wait(), timeout=delay)
+                else:
+                    await self._condition.wait()
+
+            now = time.monotonic()
+            self._in_flight += 1
+            self._requests.append(now)
+            self._tokens.append((now, estimated_tokens))
+            self._window_tokens += estimated_tokens
+
+    async def release(self, throttled: bool = False) -> None:
+        """
+        Release a slot and adjust the concurrency limit.
+
+        Args:
+            throttled: True if the provider rejected the request with a rate limit
+        """
+        async with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self.concurrency = max(1.0, self.concurrency * DECREASE_FACTOR)
+            else:
+                self.concurrency = min(
+                    float(self.max_concurrency), self.concurrency + INCREASE_STEP
+                )
+            self._condition.notify_all()
+
+    def _budget_delay(self, estimated_tokens: int) -> float:
+        """Seconds until the request and token budgets admit another request."""
+        now = time.monotonic()
+        cutoff = now - WINDOW_SECONDS
+
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            self._window_tokens -= self._tokens.popleft()[1]
+
+        delay = 0.0
+        if self.requests_per_minute and len(self._requests) >= self.requests_per_minute:
+            delay = max(delay, self._requests[0] - cutoff)
+        if (
+            self.tokens_per_minute
+            and self._tokens
+            and self._window_tokens + estimated_tokens > self.tokens_per_minute
+        ):
+            delay = max(delay, self._tokens[0][0] - cutoff)
+        return delay
+
+
+# Limiters shared by every agent, one per provider per event loop
+_limiters: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Provider, RateLimiter]] = (
+    weakref.WeakKeyDictionary()
+)
+_limiters_lock = threading.Lock()
+
+
+def _env_limit(name: str) -> int | None:
+    """
+    Read a positive integer limit from the environment (None if unset).
+
+    A malformed value is logged and ignored, so a typo in the environment
+    can't surface as a failure of every provider call.
+    """
+    value = os.environ.get(name)
+    if not value:
+        return None
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        logger.warning(f"Ignoring {name}={value!r}: expected a positive integer")
+        return None
+    return limit
+
+
+def max_concurrency_for(provider: Provider) -> int:
+    """Get the concurrency ceiling for a provider, honoring the env override."""
+    default = PROVIDER_MAX_CONCURRENCY.get(provider, DEFAULT_MAX_CONCURRENCY)
+    limit = _env_limit(f"WRITE_ASSIST_MAX_CONCURRENCY_{provider.upper()}")
+    return default if limit is None else limit
+
+
+def budgets_for(provider: Provider) -> tuple[int | None, int | None]:
+    """Get a provider's (requests, tokens) per-minute budgets from the env, if set."""
+    return (
+        _env_limit(f"WRITE_ASSIST_RPM_{provider.upper()}"),
+        _env_limit(f"WRITE_ASSIST_TPM_{provider.upper()}"),
+    )
+
+
+def get_rate_limiter(provider: Provider) -> RateLimiter:
+    """Get the shared rate limiter for a provider on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _limiters_lock:
+        loop_limiters = _limiters.setdefault(loop, {})
+        limiter = loop_limiters.get(provider)
+        if limiter is None:
+            requests_per_minute, tokens_per_minute = budgets_for(provider)
+            limiter = RateLimiter(
+                max_concurrency=max_concurrency_for(provider),
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+            )
+            loop_limiters[provider] = limiter
+    return limiter
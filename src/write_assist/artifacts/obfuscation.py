@@ -6,6 +6,8 @@ unconscious bias when editors see drafts or judges evaluate edits.
 """
 
 import random
+import re
+from itertools import permutations
 from typing import Literal
 
 from pydantic import BaseModel, PrivateAttr
@@ -21,6 +23,24 @@ ALIASES: list[Alias] = ["aleph", "bet", "gimel"]
 # All providers
 PROVIDERS: list[Provider] = ["claude", "gemini", "chatgpt"]
 
+# Every alias assignment, so a random mapping is a single choice
+_PERMUTATIONS: tuple[tuple[Provider, ...], ...] = tuple(permutations(PROVIDERS))
+
+
+def _case_variants(word: str) -> tuple[str, str, str]:
+    """The spellings that get replaced: lower, Title and UPPER case."""
+    return word, word.title(), word.upper()
+
+
+def _alternation(words: list[str]) -> re.Pattern[str]:
+    """One pattern matching every case variant of every word."""
+    return re.compile("|".join(re.escape(v) for word in words for v in _case_variants(word)))
+
+
+# Single-pass matchers; the replacement tables live on each ProviderMapping
+_PROVIDER_RE = _alternation(PROVIDERS)
+_ALIAS_RE = _alternation(ALIASES)
+
 
 class ProviderMapping(BaseModel):
     """Bidirectional mapping between providers and obfuscated aliases."""
@@ -32,13 +52,22 @@ class ProviderMapping(BaseModel):
     # Reverse lookup cache (private attribute)
     _reverse: dict[Provider, Alias] = PrivateAttr(default_factory=dict)
 
+    # Case-variant replacement tables for the text helpers below
+    _obfuscate_table: dict[str, str] = PrivateAttr(default_factory=dict)
+    _reveal_table: dict[str, str] = PrivateAttr(default_factory=dict)
+
     def model_post_init(self, __context: object) -> None:
-        """Build reverse lookup after initialization."""
+        """Build reverse lookup and replacement tables after initialization."""
         self._reverse = {
             self.aleph: "aleph",
             self.bet: "bet",
             self.gimel: "gimel",
         }
+        for provider, alias in self._reverse.items():
+            provider_variants = _case_variants(provider)
+            alias_variants = _case_variants(alias)
+            self._obfuscate_table.update(zip(provider_variants, alias_variants, strict=True))
+            self._reveal_table.update(zip(alias_variants, provider_variants, strict=True))
 
     def get_provider(self, alias: Alias) -> Provider:
         """Get the real provider for an alias."""
@@ -63,13 +92,8 @@ class ProviderMapping(BaseModel):
     @classmethod
     def create_random(cls) -> "ProviderMapping":
         """Create a new random mapping."""
-        shuffled = PROVIDERS.copy()
-        random.shuffle(shuffled)
-        return cls(
-            aleph=shuffled[0],
-            bet=shuffled[1],
-            gimel=shuffled[2],
-        )
+        aleph, bet, gimel = random.choice(_PERMUTATIONS)
+        return cls(aleph=aleph, bet=bet, gimel=gimel)
 
     @classmethod
     def from_dict(cls, mapping: dict[str, str]) -> "ProviderMapping":
@@ -87,14 +111,8 @@ def obfuscate_provider_in_text(text: str, mapping: ProviderMapping) -> str:
 
     Handles case variations: Claude, CLAUDE, claude -> aleph
     """
-    result = text
-    for provider in PROVIDERS:
-        alias = mapping.get_alias(provider)  # type: ignore
-        # Replace all case variations
-        result = result.replace(provider, alias)
-        result = result.replace(provider.title(), alias.title())
-        result = result.replace(provider.upper(), alias.upper())
-    return result
+    table = mapping._obfuscate_table
+    return _PROVIDER_RE.sub(lambda m: table[m[0]], text)
 
 
 def reveal_provider_in_text(text: str, mapping: ProviderMapping) -> str:
@@ -103,11 +121,5 @@ def reveal_provider_in_text(text: str, mapping: ProviderMapping) -> str:
 
     Handles case variations: Aleph, ALEPH, aleph -> claude
     """
-    result = text
-    for alias in ALIASES:
-        provider = mapping.get_provider(alias)
-        # Replace all case variations
-        result = result.replace(alias, provider)
-        result = result.replace(alias.title(), provider.title())
-        result = result.replace(alias.upper(), provider.upper())
-    return result
+    table = mapping._reveal_table
+    return _ALIAS_RE.sub(lambda m: table[m[0]], text)
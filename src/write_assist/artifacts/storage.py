@@ -267,7 +267,9 @@ class ArtifactStore:
         rankings = judge_result.rankings
 
         # Map draft sources to aliases
-        def rank_to_dict(entry: Any) -> dict[str, Any]:
+        def rank_to_dict(entry: Any) -> dict[str, Any] | None:
+            if entry is None:
+                return None
             return {
                 "draft": self.mapping.get_alias(entry.draft_source),
                 "score": entry.overall_score,
@@ -360,15 +362,12 @@ class ArtifactStore:
 
         for provider, result in judgments.items():
             judge_alias = self.mapping.get_alias(provider)
-            r = result.rankings
-            first = self.mapping.get_alias(r.first_place.draft_source)
-            second = self.mapping.get_alias(r.second_place.draft_source)
-            third = self.mapping.get_alias(r.third_place.draft_source)
-            lines.append(
-                f"| {judge_alias.title()} | {first.title()} ({r.first_place.overall_score:.1f}) "
-                f"| {second.title()} ({r.second_place.overall_score:.1f}) "
-                f"| {third.title()} ({r.third_place.overall_score:.1f}) |"
-            )
+            places = [
+                f"{self.mapping.get_alias(entry.draft_source).title()} ({entry.overall_score:.1f})"
+                for entry in result.rankings.places()
+            ]
+            places += ["-"] * (3 - len(places))
+            lines.append(f"| {judge_alias.title()} | {' | '.join(places)} |")
 
         return "\n".join(lines)
 
@@ -1,10 +1,11 @@
 """
-LLM response caching for development and testing.
+LLM response and parsed source caching for development and testing.
 
 Caching is ENABLED by default. To disable, set:
     WRITE_ASSIST_NO_CACHE=1
 """
 
 from write_assist.caching.llm_cache import LLMCache, get_llm_cache, is_cache_enabled
+from write_assist.caching.source_cache import SourceCache, get_source_cache
 
-__all__ = ["LLMCache", "get_llm_cache", "is_cache_enabled"]
+__all__ = ["LLMCache", "SourceCache", "get_llm_cache", "get_source_cache", "is_cache_enabled"]
@@ -3,49 +3,59 @@ LLM response caching using diskcache.
 
 Caches LLM responses to avoid repeated API calls during development/testing.
 Enabled by default; set WRITE_ASSIST_NO_CACHE=1 to disable.
+
+Lookups go through a small in-memory LRU before touching the on-disk cache,
+so repeated prompts within a process skip the SQLite read entirely.
 """
 
 import hashlib
-import json
 import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 from diskcache import Cache
 
+# Number of responses kept in the in-memory LRU tier
+DEFAULT_MEMORY_ITEMS = 128
+
 
 def is_cache_enabled() -> bool:
     """Check if caching is enabled (default: True)."""
     return os.environ.get("WRITE_ASSIST_NO_CACHE", "").lower() not in ("1", "true", "yes")
 
 
-def _find_cache_dir() -> Path:
-    """Find the cache directory (project root/.cache/llm)."""
+def _find_cache_dir(name: str = "llm") -> Path:
+    """Find the cache directory (project root/.cache/<name>)."""
     # Look for project root by finding .claude directory
     current = Path.cwd()
     for parent in [current, *current.parents]:
         if (parent / ".claude").is_dir():
-            return parent / ".cache" / "llm"
+            return parent / ".cache" / name
     # Fall back to current directory
-    return current / ".cache" / "llm"
+    return current / ".cache" / name
 
 
 class LLMCache:
     """
     File-based cache for LLM responses.
 
-    Uses diskcache for persistent, automatic cache management.
+    Uses diskcache for persistent, automatic cache management, fronted by
+    an in-memory LRU for hot entries.
     """
 
-    def __init__(self, cache_dir: Path | None = None):
+    def __init__(self, cache_dir: Path | None = None, memory_items: int = DEFAULT_MEMORY_ITEMS):
         """
         Initialize the cache.
 
         Args:
             cache_dir: Directory for cache storage. Defaults to .cache/llm/
+            memory_items: Max responses held in memory (0 disables the memory tier)
         """
         self._cache_dir = cache_dir or _find_cache_dir()
         self._cache: Cache | None = None
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._memory_items = memory_items
 
     @property
     def cache(self) -> Cache:
@@ -78,15 +88,12 @@ class LLMCache:
         Returns:
             SHA-256 hash of the parameters
         """
-        key_data = {
-            "provider": provider,
-            "model": model,
-            "prompt": prompt,
-            "system_message": system_message,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
+        # Fixed-shape fields first; the system message's length marks where the
+        # prompt starts, so no JSON encoding (or escaping) of the texts is needed
+        key_str = (
+            f"{provider}\0{model}\0{temperature!r}\0{max_tokens}\0"
+            f"{len(system_message)}\0{system_message}{prompt}"
+        )
         return hashlib.sha256(key_str.encode()).hexdigest()
 
     def get(self, key: str) -> str | None:
@@ -101,7 +108,16 @@ class LLMCache:
         """
         if not is_cache_enabled():
             return None
-        return self.cache.get(key)
+
+        response = self._memory.get(key)
+        if response is not None:
+            self._memory.move_to_end(key)
+            return response
+
+        response = self.cache.get(key)
+        if response is not None:
+            self._remember(key, response)
+        return response
 
     def set(self, key: str, response: str) -> None:
         """
@@ -114,6 +130,16 @@ class LLMCache:
         if not is_cache_enabled():
             return
         self.cache.set(key, response)
+        self._remember(key, response)
+
+    def _remember(self, key: str, response: str) -> None:
+        """Add a response to the in-memory LRU, evicting the oldest entry."""
+        if self._memory_items <= 0:
+            return
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._memory_items:
+            self._memory.popitem(last=False)
 
     def clear(self) -> int:
         """
@@ -124,6 +150,7 @@ class LLMCache:
         """
         count = len(self.cache)
         self.cache.clear()
+        self._memory.clear()
         return count
 
     def stats(self) -> dict[str, Any]:
@@ -136,6 +163,7 @@ class LLMCache:
         return {
             "enabled": is_cache_enabled(),
             "count": len(self.cache),
+            "memory_count": len(self._memory),
             "size_bytes": self.cache.volume(),
             "directory": str(self._cache_dir),
         }
@@ -0,0 +1,135 @@
+"""
+Parsed source document caching using diskcache.
+
+Keeps the JSON of parsed local files across runs, so re-running the
+pipeline on the same sources skips PDF and Word parsing. Shares the
+WRITE_ASSIST_NO_CACHE switch with the LLM cache.
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any
+
+from diskcache import Cache
+
+from write_assist.caching.llm_cache import _find_cache_dir, is_cache_enabled
+
+
+class SourceCache:
+    """
+    File-based cache for parsed source documents.
+
+    Entries are SourceDocument JSON keyed by file identity (path, mtime,
+    size), so an edited file misses instead of returning stale content.
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache storage. Defaults to .cache/sources/
+        """
+        self._cache_dir = cache_dir or _find_cache_dir("sources")
+        self._cache: Cache | None = None
+        # Sources load on worker threads; open the cache only once
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self) -> Cache:
+        """Lazy-initialize the cache."""
+        with self._lock:
+            if self._cache is None:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                self._cache = Cache(str(self._cache_dir))
+            return self._cache
+
+    @staticmethod
+    def make_key(resolved_path: Path, path: str, mtime_ns: int, size: int) -> str:
+        """
+        Create a cache key for a local file.
+
+        Args:
+            resolved_path: Absolute path of the file
+            path: Path as given by the caller (stored on the document)
+            mtime_ns: File modification time in nanoseconds
+            size: File size in bytes
+
+        Returns:
+            SHA-256 hash of the file identity
+        """
+        key_str = f"{resolved_path}\0{path}\0{mtime_ns}\0{size}"
+        return hashlib.sha256(key_str.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        Get a cached document.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached SourceDocument JSON, or None if not found
+        """
+        if not is_cache_enabled():
+            return None
+        return self.cache.get(key)
+
+    def set(self, key: str, document_json: str) -> None:
+        """
+        Store a document in cache.
+
+        Args:
+            key: Cache key from make_key()
+            document_json: SourceDocument serialized with model_dump_json()
+        """
+        if not is_cache_enabled():
+            return
+        self.cache.set(key, document_json)
+
+    def clear(self) -> int:
+        """
+        Clear all cached documents.
+
+        Returns:
+            Number of items cleared
+        """
+        count = len(self.cache)
+        self.cache.clear()
+        return count
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with cache stats (count, size, directory)
+        """
+        return {
+            "enabled": is_cache_enabled(),
+            "count": len(self.cache),
+            "size_bytes": self.cache.volume(),
+            "directory": str(self._cache_dir),
+        }
+
+    def close(self) -> None:
+        """Close the cache connection."""
+        with self._lock:
+            if self._cache is not None:
+                self._cache.close()
+                self._cache = None
+
+
+# Global cache instance
+_source_cache: SourceCache | None = None
+_source_cache_lock = threading.Lock()
+
+
+def get_source_cache() -> SourceCache:
+    """Get the global source document cache instance."""
+    global _source_cache
+    with _source_cache_lock:
+        if _source_cache is None:
+            _source_cache = SourceCache()
+    return _source_cache
@@ -9,7 +9,6 @@ from typing import Any
 import httpx
 
 from write_assist.citations.models import (
-    CitationResult,
     CitationSearchRequest,
     CitationSearchResponse,
     CiteAssistUnavailable,
@@ -102,38 +101,13 @@ class CiteAssistClient:
         try:
             response = await self._client.post(
                 "/api/v3/search",
-                json=request.model_dump(),
+                content=request.model_dump_json(),
+                headers={"Content-Type": "application/json"},
             )
             response.raise_for_status()
-            data = response.json()
-
-            # Parse results
-            results = []
-            for item in data.get("results", []):
-                results.append(
-                    CitationResult(
-                        id=item.get("id", ""),
-                        title=item.get("title", "Unknown"),
-                        result_type=item.get("result_type", "chunk"),
-                        score=item.get("score", 0.0),
-                        chunk_text=item.get("chunk_text"),
-                        chunk_index=item.get("chunk_index"),
-                        summary=item.get("summary"),
-                        chunk_score=item.get("chunk_score"),
-                        summary_score=item.get("summary_score"),
-                        authors=item.get("authors", []),
-                        year=item.get("year"),
-                        journal=item.get("journal"),
-                        volume=item.get("volume"),
-                        pages=item.get("pages"),
-                    )
-                )
-
-            return CitationSearchResponse(
-                results=results,
-                total=data.get("total", len(results)),
-                query_time_ms=data.get("query_time_ms", 0),
-            )
+
+            # Decode and validate the body in a single pass
+            return CitationSearchResponse.model_validate_json(response.content)
 
         except httpx.ConnectError as e:
             logger.warning(f"cite-assist unavailable: {e}")
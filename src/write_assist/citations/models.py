@@ -2,7 +2,9 @@
 Pydantic models for cite-assist integration.
 """
 
-from pydantic import BaseModel, Field
+from typing import Self
+
+from pydantic import BaseModel, Field, model_validator
 
 
 class CitationSearchRequest(BaseModel):
@@ -22,10 +24,10 @@ class CitationSearchRequest(BaseModel):
 class CitationResult(BaseModel):
     """A single citation result from cite-assist."""
 
-    id: str = Field(..., description="Zotero item key")
-    title: str = Field(..., description="Document title")
-    result_type: str = Field(..., description="Result type: chunk or summary")
-    score: float = Field(..., description="Relevance score (0-1)")
+    id: str = Field(default="", description="Zotero item key")
+    title: str = Field(default="Unknown", description="Document title")
+    result_type: str = Field(default="chunk", description="Result type: chunk or summary")
+    score: float = Field(default=0.0, description="Relevance score (0-1)")
     chunk_text: str | None = Field(default=None, description="Matching text chunk")
     chunk_index: int | None = Field(default=None, description="Index of chunk in document")
     summary: str | None = Field(default=None, description="Document summary")
@@ -66,6 +68,13 @@ class CitationSearchResponse(BaseModel):
     total: int = Field(default=0, description="Total matching documents")
     query_time_ms: float = Field(default=0, description="Query execution time in ms")
 
+    @model_validator(mode="after")
+    def _default_total(self) -> Self:
+        """Fall back to the number of results when the API omits a total."""
+        if "total" not in self.model_fields_set:
+            self.total = len(self.results)
+        return self
+
 
 class CiteAssistError(Exception):
     """Error from cite-assist service."""
@@ -16,8 +16,9 @@ from write_assist.cli.output import (
     print_models_table,
     print_status_table,
 )
+from write_assist.http import close_async_client
 from write_assist.llm import LLMClient
-from write_assist.pipeline import PipelineProgress, WritingPipeline
+from write_assist.pipeline import PipelineProgress, PipelineResult, WritingPipeline
 
 # =============================================================================
 # Run Command
@@ -183,17 +184,24 @@ def run_cmd(
             console.print(f"[dim]Sources: {len(sources)} document(s)[/dim]")
         console.print()
 
+    async def run_pipeline() -> PipelineResult:
+        try:
+            async with pipeline:
+                pipeline.create_llm_clients()
+                return await pipeline.run(
+                    topic=topic,
+                    document_type=doc_type,  # type: ignore
+                    section_outline=outline,
+                    source_files=list(sources) if sources else None,
+                    target_length=length,
+                    on_progress=on_progress if verbose else None,
+                )
+        finally:
+            # This loop ends with the run; close its pooled tool connections
+            await close_async_client()
+
     try:
-        result = asyncio.run(
-            pipeline.run(
-                topic=topic,
-                document_type=doc_type,  # type: ignore
-                section_outline=outline,
-                source_files=list(sources) if sources else None,
-                target_length=length,
-                on_progress=on_progress if verbose else None,
-            )
-        )
+        result = asyncio.run(run_pipeline())
     except Exception as e:
         console.print(f"[red]Pipeline failed:[/red] {e}")
         raise click.Abort() from e
@@ -14,6 +14,14 @@ from write_assist.pipeline import PipelineProgress, PipelineResult
 
 console = Console()
 
+_STATUS_ICONS = {
+    "starting": "🚀",
+    "running": "⏳",
+    "completed": "✅",
+    "failed": "❌",
+}
+_DEFAULT_ICON = "•"
+
 
 def create_progress_display() -> Progress:
     """Create a rich progress display for pipeline execution."""
@@ -28,13 +36,7 @@ def create_progress_display() -> Progress:
 
 def format_progress_update(progress: PipelineProgress) -> str:
     """Format a progress update for display."""
-    status_icons = {
-        "starting": "🚀",
-        "running": "⏳",
-        "completed": "✅",
-        "failed": "❌",
-    }
-    icon = status_icons.get(progress.status, "•")
+    icon = _STATUS_ICONS.get(progress.status, _DEFAULT_ICON)
     return f"{icon} [{progress.phase}] {progress.message}"
 
 
@@ -62,6 +64,8 @@ def output_json(result: PipelineResult) -> None:
         },
         "consensus_ranking": result.consensus_ranking,
         "total_execution_time_ms": result.total_execution_time_ms,
+        "total_tokens_used": result.total_tokens_used,
+        "total_cached_tokens": result.total_cached_tokens,
     }
 
     if result.recommended_edit:
@@ -120,12 +124,12 @@ def output_interactive(result: PipelineResult) -> None:
         rankings_table.add_column("3rd Place")
 
         for provider, judge_result in result.judge_results.items():
-            rankings_table.add_row(
-                provider.title(),
-                f"{judge_result.rankings.first_place.draft_source} ({judge_result.rankings.first_place.overall_score:.1f})",
-                f"{judge_result.rankings.second_place.draft_source} ({judge_result.rankings.second_place.overall_score:.1f})",
-                f"{judge_result.rankings.third_place.draft_source} ({judge_result.rankings.third_place.overall_score:.1f})",
-            )
+            places = [
+                f"{entry.draft_source} ({entry.overall_score:.1f})"
+                for entry in judge_result.rankings.places()
+            ]
+            places += ["-"] * (3 - len(places))
+            rankings_table.add_row(provider.title(), *places)
 
         console.print(rankings_table)
 
@@ -0,0 +1,50 @@
+"""
+Shared HTTP client for outbound tool requests.
+
+One pooled httpx.AsyncClient per event loop, so repeated searches reuse
+open connections instead of paying a TCP/TLS handshake per request.
+"""
+
+import asyncio
+import threading
+import weakref
+
+import httpx
+
+# Request timeout, in seconds
+DEFAULT_TIMEOUT = 30.0
+
+# Connection pool caps, shared by every caller on a loop
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+# Clients are bound to the loop that created them
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=DEFAULT_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+            _clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the running loop's shared client; the next call opens a new one."""
+    with _clients_lock:
+        client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
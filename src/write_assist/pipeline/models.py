@@ -2,7 +2,7 @@
 Data models for pipeline execution.
 """
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -17,26 +17,27 @@ from write_assist.agents.models import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PhaseResult:
-    """Result of a single pipeline phase."""
+    """Result of a single pipeline phase (immutable; empty results are shared)."""
 
     phase_name: str
     successful: dict[Provider, Any]
     failed: dict[Provider, Any]
     execution_time_ms: float
     tokens_used: int = 0
+    cached_tokens: int = 0
 
-    @property
-    def success_count(self) -> int:
-        return len(self.successful)
+    # Derived once from the dicts above, which are not modified after construction
+    success_count: int = field(init=False, repr=False, compare=False)
+    all_succeeded: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def all_succeeded(self) -> bool:
-        return len(self.failed) == 0
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "success_count", len(self.successful))
+        object.__setattr__(self, "all_succeeded", not self.failed)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """Complete result of a pipeline execution."""
 
@@ -59,11 +60,22 @@ class PipelineResult:
 
     # Metadata
     total_tokens_used: int = 0
+    total_cached_tokens: int = 0
     total_execution_time_ms: float = 0
     started_at: datetime = field(default_factory=datetime.now)
     completed_at: datetime | None = None
     artifact_path: Path | None = None
 
+    # Memoized get_rankings_summary() (judge_results are final once built)
+    _rankings_summary: dict[Provider, dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def billed_tokens(self) -> int:
+        """Tokens billed at full price (total minus provider cache reads)."""
+        return self.total_tokens_used - self.total_cached_tokens
+
     @property
     def all_phases_succeeded(self) -> bool:
         """Check if all phases completed successfully."""
@@ -84,20 +96,25 @@ class PipelineResult:
 
     def get_rankings_summary(self) -> dict[Provider, dict[str, Any]]:
         """Get a summary of rankings from all judges."""
+        if self._rankings_summary is not None:
+            return self._rankings_summary
+
         summary: dict[Provider, dict[str, Any]] = {}
 
         for provider, judge_result in self.judge_results.items():
+            rankings = judge_result.rankings
             summary[provider] = {
-                "first": judge_result.rankings.first_place.draft_source,
-                "second": judge_result.rankings.second_place.draft_source,
-                "third": judge_result.rankings.third_place.draft_source,
-                "first_score": judge_result.rankings.first_place.overall_score,
+                "first": rankings.first_place.draft_source,
+                "second": rankings.second_place.draft_source if rankings.second_place else None,
+                "third": rankings.third_place.draft_source if rankings.third_place else None,
+                "first_score": rankings.first_place.overall_score,
             }
 
+        self._rankings_summary = summary
         return summary
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineProgress:
     """Progress update during pipeline execution."""
 
@@ -108,5 +125,5 @@ class PipelineProgress:
     progress_pct: float = 0.0
 
 
-# Type alias for progress callback
-ProgressCallback = Callable[[PipelineProgress], None]
+# Type alias for progress callback (plain function or coroutine function)
+ProgressCallback = Callable[[PipelineProgress], None | Awaitable[None]]
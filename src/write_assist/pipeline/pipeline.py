@@ -4,11 +4,17 @@ Writing pipeline orchestration.
 Chains drafter → editor → judge phases for multi-LLM ensemble writing.
 """
 
+import asyncio
+import contextlib
+import inspect
 import logging
 import time
-from collections import Counter
-from datetime import datetime
+from collections.abc import Callable
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
 
 from write_assist.agents import (
     DrafterAgent,
@@ -21,9 +27,18 @@ from write_assist.agents import (
     JudgeInput,
     JudgeResult,
 )
-from write_assist.agents.models import DocumentType, LoadedSource, LocalCitation, Provider
+from write_assist.agents.base import BaseAgent, ResultCallback, get_llm_client
+from write_assist.agents.models import (
+    AgentError,
+    DocumentType,
+    LoadedSource,
+    LocalCitation,
+    ParallelRunResult,
+    Provider,
+)
 from write_assist.artifacts import ArtifactStore
 from write_assist.citations import CiteAssistClient, CiteAssistUnavailable
+from write_assist.llm import LLMError
 from write_assist.pipeline.models import (
     PhaseResult,
     PipelineProgress,
@@ -34,6 +49,113 @@ from write_assist.sources import SourceLoader
 
 logger = logging.getLogger(__name__)
 
+# Seconds the slowest provider gets after a phase quorum finishes, with early editing/judging
+DEFAULT_STRAGGLER_TIMEOUT = 30.0
+
+# Drafts needed before editing can start early
+DRAFT_QUORUM = 2
+
+# Edits needed before judging can start early
+EDIT_QUORUM = 2
+
+# Shared results for phases that never ran (PhaseResult is frozen)
+_EMPTY_EDITING_PHASE = PhaseResult(
+    phase_name="editing",
+    successful={},
+    failed={},
+    execution_time_ms=0,
+)
+_EMPTY_JUDGING_PHASE = PhaseResult(
+    phase_name="judging",
+    successful={},
+    failed={},
+    execution_time_ms=0,
+)
+
+
+class _ProgressReporter:
+    """
+    Delivers progress updates outside the pipeline code that raises them.
+
+    Updates are queued and handed to the callback, in order, by a single
+    background task. Sync callbacks run on a worker thread, so a slow
+    listener delays neither the phase that reported nor the provider calls
+    in flight. The task exits once the queue is empty and restarts on the
+    next update. drain() flushes outstanding deliveries.
+    """
+
+    def __init__(self, callback: ProgressCallback):
+        self._callback = callback
+        self._is_async = inspect.iscoroutinefunction(callback)
+        self._queue: asyncio.Queue[PipelineProgress] = asyncio.Queue()
+        self._consumer: asyncio.Task[None] | None = None
+
+    def __call__(self, progress: PipelineProgress) -> None:
+        self._queue.put_nowait(progress)
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.create_task(self._deliver())
+
+    async def drain(self) -> None:
+        """Wait until every update reported so far has been delivered."""
+        if self._consumer is not None:
+            await self._consumer
+
+    async def _deliver(self) -> None:
+        """Hand queued updates to the callback until the queue is empty."""
+        while not self._queue.empty():
+            progress = self._queue.get_nowait()
+            try:
+                if self._is_async:
+                    await self._callback(progress)  # type: ignore[misc]
+                else:
+                    await asyncio.to_thread(self._callback, progress)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+
+
+class _ArtifactWriter:
+    """
+    Runs ArtifactStore writes on worker threads, overlapping the LLM phases.
+
+    The store's directories are created in the background too; every write
+    waits for that first. Await ready() before spending tokens, so an
+    unwritable output directory fails the run up front, and flush() before
+    touching the manifest. discard() drops outstanding writes.
+    """
+
+    def __init__(self, store: ArtifactStore):
+        self.store = store
+        self._ready = asyncio.create_task(asyncio.to_thread(store.initialize))
+        self._pending: list[asyncio.Task[None]] = []
+
+    async def ready(self) -> None:
+        """Wait for the run directory, raising if it couldn't be created."""
+        await self._ready
+
+    def save(self, save: Callable[..., None], *args: Any) -> None:
+        """Schedule one store write."""
+        self._pending.append(asyncio.create_task(self._write(save, *args)))
+
+    async def flush(self) -> None:
+        """Wait for initialization and every scheduled write."""
+        await self._ready
+        await asyncio.gather(*self._pending)
+
+    async def discard(self) -> None:
+        """Cancel initialization and outstanding writes, and wait for them to stop."""
+        tasks = [self._ready, *self._pending]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _write(self, save: Callable[..., None], *args: Any) -> None:
+        """Run one write, logging failures so they can't sink the run."""
+        try:
+            await self._ready
+            await asyncio.to_thread(save, *args)
+        except Exception as e:
+            logger.warning(f"Failed to write artifacts ({save.__name__}): {e}")
+
 
 class WritingPipeline:
     """
@@ -46,13 +168,16 @@ class WritingPipeline:
 
     Human review of judge rankings produces the final selection.
 
+    Use it as an async context manager to reuse one cite-assist connection
+    across runs; otherwise each run opens its own.
+
     Example:
-        >>> pipeline = WritingPipeline()
-        >>> result = await pipeline.run(
-        ...     topic="The doctrine of consideration",
-        ...     document_type="article",
-        ...     section_outline="1. Introduction\\n2. History\\n3. Conclusion"
-        ... )
+        >>> async with WritingPipeline() as pipeline:
+        ...     result = await pipeline.run(
+        ...         topic="The doctrine of consideration",
+        ...         document_type="article",
+        ...         section_outline="1. Introduction\\n2. History\\n3. Conclusion"
+        ...     )
         >>> print(result.consensus_ranking)  # ['claude', 'gemini', 'chatgpt']
         >>> print(result.recommended_edit.integrated_draft.content)
     """
@@ -66,6 +191,10 @@ class WritingPipeline:
         use_cite_assist: bool = True,
         output_dir: Path | str | None = None,
         save_artifacts: bool = True,
+        max_concurrency: int | None = None,
+        early_editing: bool = False,
+        early_judging: bool = False,
+        straggler_timeout: float = DEFAULT_STRAGGLER_TIMEOUT,
     ):
         """
         Initialize the pipeline.
@@ -78,6 +207,13 @@ class WritingPipeline:
             use_cite_assist: Whether to query cite-assist for local citations
             output_dir: Directory to save artifacts (default: ./runs)
             save_artifacts: Whether to save artifacts to disk (default: True)
+            max_concurrency: Maximum concurrent provider calls per phase (default: unbounded)
+            early_editing: Start editing once 2 drafters have finished, giving the
+                last one straggler_timeout seconds before it is cancelled
+            early_judging: Start judging once 2 editors have finished, giving the
+                last one straggler_timeout seconds before it is cancelled
+            straggler_timeout: Grace period for the slowest provider with
+                early_editing or early_judging
         """
         self.project_root = project_root
         self.models = models
@@ -86,6 +222,13 @@ class WritingPipeline:
         self.cite_assist_library_id = cite_assist_library_id
         self.output_dir = Path(output_dir) if output_dir else Path("./runs")
         self.save_artifacts = save_artifacts
+        self.max_concurrency = max_concurrency
+        self.early_editing = early_editing
+        self.early_judging = early_judging
+        self.straggler_timeout = straggler_timeout
+
+        # Shared cite-assist client, open while the pipeline is used with `async with`
+        self._cite_client: CiteAssistClient | None = None
 
         # Initialize agents
         self.drafter = DrafterAgent(project_root=project_root, models=models)
@@ -97,6 +240,59 @@ class WritingPipeline:
             on_error="warn",  # Log warnings but don't fail pipeline
         )
 
+    async def __aenter__(self) -> "WritingPipeline":
+        """Open a cite-assist client that is reused by every run until exit."""
+        if self.use_cite_assist and self._cite_client is None:
+            self._cite_client = await self._make_cite_client().__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Close the shared cite-assist client."""
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the shared cite-assist client, if open.
+
+        The pooled tool HTTP client is shared across the event loop, so it is
+        left to whoever owns the loop to close.
+        """
+        if self._cite_client is not None:
+            await self._cite_client.close()
+            self._cite_client = None
+
+    def _make_cite_client(self) -> CiteAssistClient:
+        """Create a cite-assist client from the pipeline's settings."""
+        return CiteAssistClient(
+            base_url=self.cite_assist_url,
+            library_id=self.cite_assist_library_id,
+        )
+
+    def create_llm_clients(self, providers: list[Provider] | None = None) -> list[Provider]:
+        """
+        Build the shared LLM client for each provider ahead of the first run.
+
+        Saves the first phase's fan-out from paying SDK client setup, and
+        reports which providers are usable. Makes no network calls. Call from
+        inside the event loop that will run the pipeline; clients are per-loop.
+
+        Args:
+            providers: Providers to prepare (defaults to all three)
+
+        Returns:
+            Providers whose client is ready (e.g. excludes missing API keys)
+        """
+        ready: list[Provider] = []
+        for provider in providers or ["claude", "gemini", "chatgpt"]:
+            try:
+                get_llm_client(provider, self.drafter.models.get(provider) or "")
+            except LLMError as e:
+                logger.warning(f"No LLM client for {provider}: {e}")
+                continue
+            ready.append(provider)
+
+        return ready
+
     async def run(
         self,
         topic: str,
@@ -110,6 +306,7 @@ class WritingPipeline:
         max_tokens_judging: int | None = None,
         temperature: float = 0.7,
         on_progress: ProgressCallback | None = None,
+        force_judge: bool = False,
     ) -> PipelineResult:
         """
         Run the full writing pipeline.
@@ -125,7 +322,9 @@ class WritingPipeline:
             max_tokens_editing: Maximum tokens for editing phase (default: 2x max_tokens)
             max_tokens_judging: Maximum tokens for judging phase (default: 2x max_tokens)
             temperature: Sampling temperature for LLM calls
-            on_progress: Optional callback for progress updates
+            on_progress: Optional callback for progress updates, sync or async.
+                Updates are delivered asynchronously and flushed before run returns.
+            force_judge: Run the judges even when only one edit succeeded
 
         Returns:
             PipelineResult with all phase outputs and rankings
@@ -140,311 +339,423 @@ class WritingPipeline:
         started_at = datetime.now()
         total_start = time.perf_counter()
 
-        # =====================================================================
-        # Initialize artifact storage
-        # =====================================================================
-        artifact_store: ArtifactStore | None = None
-        if self.save_artifacts:
-            artifact_store = ArtifactStore(
-                output_dir=self.output_dir,
-                topic=topic,
-                started_at=started_at,
-            ).initialize()
-            self._notify(
-                on_progress,
-                "artifacts",
-                "starting",
-                message=f"Saving artifacts to {artifact_store.run_dir}",
-            )
-
-        # =====================================================================
-        # Pre-Phase 1: Load source documents
-        # =====================================================================
-        source_documents: list[LoadedSource] = []
-        if source_files:
-            self._notify(on_progress, "sources", "starting", message="Loading source documents")
-            source_documents = self._load_sources(source_files)
-            self._notify(
-                on_progress,
-                "sources",
-                "completed",
-                message=f"Loaded {len(source_documents)}/{len(source_files)} sources",
-            )
+        # Keep user callbacks off the pipeline's critical path
+        reporter = _ProgressReporter(on_progress) if on_progress else None
+        on_progress = reporter
 
-        # =====================================================================
-        # Pre-Phase 2: Query cite-assist for local citations
-        # =====================================================================
-        local_citations: list[LocalCitation] = []
+        # cite-assist only needs the topic, so query it while artifacts are
+        # set up and sources load rather than after
+        cite_task: asyncio.Task[list[LocalCitation]] | None = None
         if self.use_cite_assist:
             self._notify(
                 on_progress, "research", "starting", message="Querying local citation database"
             )
-            local_citations = await self._query_cite_assist(topic)
-            self._notify(
-                on_progress,
-                "research",
-                "completed",
-                message=f"Found {len(local_citations)} relevant citations",
-            )
-
-        # Build drafter input
-        drafter_input = DrafterInput(
-            topic=topic,
-            document_type=document_type,
-            section_outline=section_outline,
-            source_files=source_files or [],
-            source_documents=source_documents,
-            target_length=target_length,
-            audience=audience,
-            local_citations=local_citations,
-        )
-
-        # Save input artifacts
-        if artifact_store:
-            artifact_store.save_input(drafter_input)
+            cite_task = asyncio.create_task(self._query_cite_assist(topic))
 
         # =====================================================================
-        # Phase 1: Drafting
+        # Initialize artifact storage
         # =====================================================================
-        self._notify(on_progress, "drafting", "starting", message="Starting drafting phase")
-
-        phase1_start = time.perf_counter()
-        draft_parallel_result = await self.drafter.run_parallel(
-            inputs=drafter_input,
-            max_tokens=max_tokens,
-            temperature=temperature,
-        )
-        phase1_time = (time.perf_counter() - phase1_start) * 1000
-
-        drafting_phase = PhaseResult(
-            phase_name="drafting",
-            successful=draft_parallel_result.successful,
-            failed=draft_parallel_result.failed,
-            execution_time_ms=phase1_time,
-        )
-
-        self._notify(
-            on_progress,
-            "drafting",
-            "completed",
-            message=f"Drafting complete: {drafting_phase.success_count}/3 succeeded",
-        )
+        writer: _ArtifactWriter | None = None
+        try:
+            if self.save_artifacts:
+                # Creates the run directory in the background; writes wait for it
+                writer = _ArtifactWriter(
+                    ArtifactStore(
+                        output_dir=self.output_dir,
+                        topic=topic,
+                        started_at=started_at,
+                    )
+                )
+                self._notify(
+                    on_progress,
+                    "artifacts",
+                    "starting",
+                    "Saving artifacts to %s",
+                    writer.store.run_dir,
+                )
 
-        # Save draft artifacts
-        if artifact_store and draft_parallel_result.successful:
-            artifact_store.save_drafts(draft_parallel_result.successful)
+            # =====================================================================
+            # Pre-Phase 1: Load source documents
+            # =====================================================================
+            source_documents: list[LoadedSource] = []
+            if source_files:
+                self._notify(on_progress, "sources", "starting", message="Loading source documents")
+                try:
+                    source_documents = await self._load_sources(source_files)
+                except BaseException:
+                    # Don't leave the cite-assist query running behind a failed run
+                    if cite_task:
+                        cite_task.cancel()
+                    raise
+                self._notify(
+                    on_progress,
+                    "sources",
+                    "completed",
+                    "Loaded %d/%d sources",
+                    len(source_documents),
+                    len(source_files),
+                )
 
-        # Save any errors with raw responses for debugging
-        if artifact_store and draft_parallel_result.failed:
-            raw_responses = {
-                p: self.drafter.get_failed_raw_response(p)
-                for p in draft_parallel_result.failed
-                if self.drafter.get_failed_raw_response(p)
-            }
-            artifact_store.save_errors("drafting", draft_parallel_result.failed, raw_responses)
-
-        # Check if we have enough drafts to continue
-        if drafting_phase.success_count < 1:
-            if artifact_store:
-                artifact_store.finalize(
-                    execution_time_ms=(time.perf_counter() - total_start) * 1000,
-                    phase_results={"drafting": "failed"},
+            # =====================================================================
+            # Pre-Phase 2: Collect local citations from cite-assist
+            # =====================================================================
+            local_citations: list[LocalCitation] = []
+            if cite_task:
+                local_citations = await cite_task
+                self._notify(
+                    on_progress,
+                    "research",
+                    "completed",
+                    "Found %d relevant citations",
+                    len(local_citations),
                 )
-            return self._create_failed_result(
-                drafter_input, drafting_phase, started_at, total_start
+
+            # Build drafter input
+            drafter_input = DrafterInput(
+                topic=topic,
+                document_type=document_type,
+                section_outline=section_outline,
+                source_files=source_files or [],
+                source_documents=source_documents,
+                target_length=target_length,
+                audience=audience,
+                local_citations=local_citations,
             )
 
-        # =====================================================================
-        # Phase 2: Editing
-        # =====================================================================
-        self._notify(on_progress, "editing", "starting", message="Starting editing phase")
+            # Save input artifacts. The run directory must exist before any tokens are spent
+            if writer:
+                await writer.ready()
+                writer.save(writer.store.save_input, drafter_input)
+
+            # =====================================================================
+            # Phase 1: Drafting
+            # =====================================================================
+            drafting_phase, draft_parallel_result = await self._run_phase(
+                "drafting",
+                self.drafter,
+                drafter_input,
+                on_progress,
+                writer,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                quorum=DRAFT_QUORUM if self.early_editing else None,
+                straggler_timeout=self.straggler_timeout,
+            )
 
-        # Build editor input with all successful drafts
-        # If we have fewer than 3 drafts, duplicate the best one to fill gaps
-        drafts_list = self._prepare_drafts_for_editing(draft_parallel_result.successful)
+            # Save draft artifacts
+            if writer and draft_parallel_result.successful:
+                writer.save(writer.store.save_drafts, draft_parallel_result.successful)
+
+            # Check if we have enough drafts to continue
+            if drafting_phase.success_count < 1:
+                total_time = (time.perf_counter() - total_start) * 1000
+                if writer:
+                    await writer.flush()
+                    writer.store.finalize(
+                        completed_at=started_at + timedelta(milliseconds=total_time),
+                        execution_time_ms=total_time,
+                        phase_results={"drafting": "failed"},
+                    )
+                if reporter:
+                    await reporter.drain()
+                return self._create_failed_result(
+                    drafter_input, drafting_phase, started_at, total_time
+                )
 
-        editor_input = EditorInput(
-            drafts=drafts_list,
-            original_context=drafter_input,
-        )
+            # =====================================================================
+            # Phase 2: Editing
+            # =====================================================================
+            # Build editor input with all successful drafts
+            drafts_list = self._prepare_drafts_for_editing(draft_parallel_result.successful)
 
-        phase2_start = time.perf_counter()
-        edit_parallel_result = await self.editor.run_parallel(
-            inputs=editor_input,
-            max_tokens=max_tokens_editing,
-            temperature=temperature,
-        )
-        phase2_time = (time.perf_counter() - phase2_start) * 1000
+            editor_input = EditorInput(
+                drafts=drafts_list,
+                providers=list(draft_parallel_result.successful),
+                original_context=drafter_input,
+            )
 
-        editing_phase = PhaseResult(
-            phase_name="editing",
-            successful=edit_parallel_result.successful,
-            failed=edit_parallel_result.failed,
-            execution_time_ms=phase2_time,
-        )
+            editing_phase, edit_parallel_result = await self._run_phase(
+                "editing",
+                self.editor,
+                editor_input,
+                on_progress,
+                writer,
+                max_tokens=max_tokens_editing,
+                temperature=temperature,
+                quorum=EDIT_QUORUM if self.early_judging else None,
+                straggler_timeout=self.straggler_timeout,
+            )
 
-        self._notify(
-            on_progress,
-            "editing",
-            "completed",
-            message=f"Editing complete: {editing_phase.success_count}/3 succeeded",
-        )
+            # Save edit artifacts
+            if writer and edit_parallel_result.successful:
+                writer.save(writer.store.save_edits, edit_parallel_result.successful)
+
+            # Check if we have enough edits to continue
+            if editing_phase.success_count < 1:
+                total_time = (time.perf_counter() - total_start) * 1000
+                if writer:
+                    await writer.flush()
+                    writer.store.finalize(
+                        completed_at=started_at + timedelta(milliseconds=total_time),
+                        execution_time_ms=total_time,
+                        phase_results={"drafting": "completed", "editing": "failed"},
+                    )
+                if reporter:
+                    await reporter.drain()
+                return self._create_partial_result(
+                    drafter_input,
+                    drafting_phase,
+                    editing_phase,
+                    draft_parallel_result.successful,
+                    started_at,
+                    total_time,
+                )
 
-        # Save edit artifacts
-        if artifact_store and edit_parallel_result.successful:
-            artifact_store.save_edits(edit_parallel_result.successful)
+            # =====================================================================
+            # Phase 3: Judging
+            # =====================================================================
+            skip_judging = editing_phase.success_count == 1 and not force_judge
+            if skip_judging:
+                # A single edit has nothing to be ranked against; don't pay three judges to say so
+                judging_phase = _EMPTY_JUDGING_PHASE
+                judge_results: dict[Provider, JudgeResult] = {}
+                consensus = list(edit_parallel_result.successful)
+                self._notify(
+                    on_progress,
+                    "judging",
+                    "completed",
+                    message="Judging skipped: only one edit succeeded",
+                )
+            else:
+                # Build judge input with all successful edits
+                edits_list = self._prepare_edits_for_judging(edit_parallel_result.successful)
+
+                judge_input = JudgeInput(
+                    integrated_drafts=edits_list,
+                    providers=list(edit_parallel_result.successful)[: len(edits_list)],
+                    original_context=drafter_input,
+                )
 
-        # Save any errors with raw responses for debugging
-        if artifact_store and edit_parallel_result.failed:
-            raw_responses = {
-                p: self.editor.get_failed_raw_response(p)
-                for p in edit_parallel_result.failed
-                if self.editor.get_failed_raw_response(p)
-            }
-            artifact_store.save_errors("editing", edit_parallel_result.failed, raw_responses)
-
-        # Check if we have enough edits to continue
-        if editing_phase.success_count < 1:
-            if artifact_store:
-                artifact_store.finalize(
-                    execution_time_ms=(time.perf_counter() - total_start) * 1000,
-                    phase_results={"drafting": "completed", "editing": "failed"},
+                judging_phase, judge_parallel_result = await self._run_phase(
+                    "judging",
+                    self.judge,
+                    judge_input,
+                    on_progress,
+                    writer,
+                    on_result=self._judging_progress(on_progress),
+                    max_tokens=max_tokens_judging,
+                    temperature=temperature,
+                )
+                judge_results = judge_parallel_result.successful
+
+                # Calculate consensus ranking
+                consensus = self._calculate_consensus(judge_results)
+
+            # =====================================================================
+            # Aggregate Results
+            # =====================================================================
+            total_time = (time.perf_counter() - total_start) * 1000
+            # Derive the wall-clock end from the monotonic timer instead of reading the clock again
+            completed_at = started_at + timedelta(milliseconds=total_time)
+
+            # Get recommended edit (top-ranked by consensus)
+            recommended = self._get_recommended_edit(consensus, edit_parallel_result.successful)
+
+            # Save judgment and final artifacts
+            final_artifact_path = None
+            if writer:
+                await writer.flush()
+                if judge_results:
+                    writer.store.save_judgments(judge_results, consensus)
+                writer.store.save_final(recommended, consensus)
+                final_artifact_path = writer.store.finalize(
+                    completed_at=completed_at,
+                    execution_time_ms=total_time,
+                    phase_results={
+                        "drafting": "completed",
+                        "editing": "completed",
+                        "judging": "skipped" if skip_judging else "completed",
+                    },
+                )
+                self._notify(
+                    on_progress,
+                    "artifacts",
+                    "completed",
+                    "Artifacts saved to %s",
+                    final_artifact_path,
                 )
-            return self._create_partial_result(
-                drafter_input,
-                drafting_phase,
-                editing_phase,
-                draft_parallel_result.successful,
-                started_at,
-                total_start,
-            )
 
-        # =====================================================================
-        # Phase 3: Judging
-        # =====================================================================
-        self._notify(on_progress, "judging", "starting", message="Starting judging phase")
+            if reporter:
+                await reporter.drain()
+
+            return PipelineResult(
+                original_input=drafter_input,
+                drafting_phase=drafting_phase,
+                editing_phase=editing_phase,
+                judging_phase=judging_phase,
+                draft_results=draft_parallel_result.successful,
+                edit_results=edit_parallel_result.successful,
+                judge_results=judge_results,
+                consensus_ranking=consensus,
+                recommended_edit=recommended,
+                total_tokens_used=sum(
+                    phase.tokens_used for phase in (drafting_phase, editing_phase, judging_phase)
+                ),
+                total_cached_tokens=sum(
+                    phase.cached_tokens for phase in (drafting_phase, editing_phase, judging_phase)
+                ),
+                total_execution_time_ms=total_time,
+                started_at=started_at,
+                completed_at=completed_at,
+                artifact_path=final_artifact_path,
+            )
+        except BaseException:
+            # Don't leave artifact writes running behind a failed run
+            if writer:
+                await writer.discard()
+            raise
 
-        # Build judge input with all successful edits
-        edits_list = self._prepare_edits_for_judging(edit_parallel_result.successful)
+    async def _run_phase(
+        self,
+        phase: str,
+        agent: BaseAgent[Any, Any],
+        inputs: BaseModel,
+        on_progress: ProgressCallback | None,
+        writer: _ArtifactWriter | None,
+        on_result: ResultCallback | None = None,
+        **run_kwargs: Any,
+    ) -> tuple[PhaseResult, ParallelRunResult]:
+        """
+        Run one phase across all providers.
 
-        judge_input = JudgeInput(
-            integrated_drafts=edits_list,
-            original_context=drafter_input,
-        )
+        Reports progress, times the phase, and saves raw responses for any
+        failed providers. Phase-specific artifacts are left to the caller.
+        on_result replaces the default per-provider progress hook.
 
-        phase3_start = time.perf_counter()
-        judge_parallel_result = await self.judge.run_parallel(
-            inputs=judge_input,
-            max_tokens=max_tokens_judging,
-            temperature=temperature,
+        Returns:
+            The phase summary and the agent's full parallel result
+        """
+        self._notify(on_progress, phase, "starting", "Starting %s phase", phase)
+
+        phase_start = time.perf_counter()
+        parallel_result = await agent.run_parallel(
+            inputs=inputs,
+            on_result=on_result or self._provider_progress(on_progress, phase),
+            max_concurrency=self.max_concurrency,
+            **run_kwargs,
         )
-        phase3_time = (time.perf_counter() - phase3_start) * 1000
-
-        judging_phase = PhaseResult(
-            phase_name="judging",
-            successful=judge_parallel_result.successful,
-            failed=judge_parallel_result.failed,
-            execution_time_ms=phase3_time,
+        phase_time = (time.perf_counter() - phase_start) * 1000
+
+        phase_result = PhaseResult(
+            phase_name=phase,
+            successful=parallel_result.successful,
+            failed=parallel_result.failed,
+            execution_time_ms=phase_time,
+            tokens_used=parallel_result.tokens_used,
+            cached_tokens=parallel_result.cached_tokens,
         )
 
         self._notify(
             on_progress,
-            "judging",
+            phase,
             "completed",
-            message=f"Judging complete: {judging_phase.success_count}/3 succeeded",
+            "%s complete: %d/3 succeeded",
+            phase.capitalize(),
+            phase_result.success_count,
         )
 
         # Save any errors with raw responses for debugging
-        if artifact_store and judge_parallel_result.failed:
-            raw_responses = {
-                p: self.judge.get_failed_raw_response(p)
-                for p in judge_parallel_result.failed
-                if self.judge.get_failed_raw_response(p)
-            }
-            artifact_store.save_errors("judging", judge_parallel_result.failed, raw_responses)
-
-        # =====================================================================
-        # Aggregate Results
-        # =====================================================================
-        total_time = (time.perf_counter() - total_start) * 1000
-
-        # Calculate consensus ranking
-        consensus = self._calculate_consensus(judge_parallel_result.successful)
-
-        # Get recommended edit (top-ranked by consensus)
-        recommended = self._get_recommended_edit(consensus, edit_parallel_result.successful)
-
-        # Save judgment and final artifacts
-        final_artifact_path = None
-        if artifact_store:
-            if judge_parallel_result.successful:
-                artifact_store.save_judgments(judge_parallel_result.successful, consensus)
-            artifact_store.save_final(recommended, consensus)
-            final_artifact_path = artifact_store.finalize(
-                execution_time_ms=total_time,
-                phase_results={
-                    "drafting": "completed",
-                    "editing": "completed",
-                    "judging": "completed",
-                },
-            )
-            self._notify(
-                on_progress,
-                "artifacts",
-                "completed",
-                message=f"Artifacts saved to {final_artifact_path}",
+        if writer and parallel_result.failed:
+            writer.save(
+                writer.store.save_errors,
+                phase,
+                parallel_result.failed,
+                parallel_result.failed_raw_responses,
             )
 
-        return PipelineResult(
-            original_input=drafter_input,
-            drafting_phase=drafting_phase,
-            editing_phase=editing_phase,
-            judging_phase=judging_phase,
-            draft_results=draft_parallel_result.successful,
-            edit_results=edit_parallel_result.successful,
-            judge_results=judge_parallel_result.successful,
-            consensus_ranking=consensus,
-            recommended_edit=recommended,
-            total_execution_time_ms=total_time,
-            started_at=started_at,
-            completed_at=datetime.now(),
-            artifact_path=final_artifact_path,
-        )
+        return phase_result, parallel_result
 
     def _notify(
         self,
         callback: ProgressCallback | None,
         phase: str,
         status: str,
-        provider: Provider | None = None,
         message: str = "",
+        *args: object,
+        provider: Provider | None = None,
     ) -> None:
-        """Send progress notification if callback is set."""
+        """
+        Send progress notification if callback is set.
+
+        As with logging, message is %-formatted with args only when there is
+        a callback to receive it, so unobserved runs skip the formatting.
+        """
         if callback:
             callback(
                 PipelineProgress(
                     phase=phase,
                     status=status,
                     provider=provider,
-                    message=message,
+                    message=message % args if args else message,
                 )
             )
 
+    def _provider_progress(
+        self, callback: ProgressCallback | None, phase: str
+    ) -> ResultCallback | None:
+        """Build a per-provider result hook that reports each provider as it finishes."""
+        if callback is None:
+            return None
+
+        def report(provider: Provider, result: object) -> None:
+            if isinstance(result, AgentError):
+                self._notify(
+                    callback,
+                    phase,
+                    "failed",
+                    provider=provider,
+                    message=f"{provider} failed: {result.error_type}",
+                )
+            else:
+                self._notify(
+                    callback, phase, "running", provider=provider, message=f"{provider} finished"
+                )
+
+        return report
+
+    def _judging_progress(self, callback: ProgressCallback | None) -> ResultCallback | None:
+        """Build a judging hook that also reports the running Borda ranking."""
+        report = self._provider_progress(callback, "judging")
+        if report is None:
+            return None
+
+        scores: dict[Provider, int] = {}
+
+        def report_ranking(provider: Provider, result: object) -> None:
+            report(provider, result)
+            if isinstance(result, JudgeResult):
+                self._add_borda_points(scores, result)
+                ranking = ", ".join(self._rank_by_score(scores))
+                self._notify(
+                    callback,
+                    "judging",
+                    "running",
+                    provider=provider,
+                    message=f"Provisional ranking: {ranking}",
+                )
+
+        return report_ranking
+
     def _prepare_drafts_for_editing(
         self, successful_drafts: dict[Provider, DraftResult]
     ) -> list[DraftResult]:
         """
         Prepare drafts list for editor input.
 
-        Ensures we always have 3 drafts by duplicating if needed.
+        Editors label each draft by its provider, so missing drafts are left
+        out rather than padded with duplicates the editors would pay to read.
         """
-        drafts = list(successful_drafts.values())
-
-        # If we have fewer than 3, duplicate to fill
-        while len(drafts) < 3:
-            drafts.append(drafts[0])  # Duplicate first draft
-
-        return drafts[:3]
+        return list(successful_drafts.values())
 
     def _prepare_edits_for_judging(
         self, successful_edits: dict[Provider, EditResult]
@@ -452,14 +763,11 @@ class WritingPipeline:
         """
         Prepare edits list for judge input.
 
-        Ensures we always have 3 edits by duplicating if needed.
+        Judges label each edit by its provider, so missing edits are left
+        out rather than padded with duplicates.
         """
         edits = list(successful_edits.values())
 
-        # If we have fewer than 3, duplicate to fill
-        while len(edits) < 3:
-            edits.append(edits[0])  # Duplicate first edit
-
         return edits[:3]
 
     def _calculate_consensus(self, judge_results: dict[Provider, JudgeResult]) -> list[Provider]:
@@ -471,16 +779,42 @@ class WritingPipeline:
         if not judge_results:
             return []
 
-        scores: Counter[Provider] = Counter()
+        scores: dict[Provider, int] = {}
 
         for judge_result in judge_results.values():
-            rankings = judge_result.rankings
-            scores[rankings.first_place.draft_source] += 3
-            scores[rankings.second_place.draft_source] += 2
-            scores[rankings.third_place.draft_source] += 1
+            self._add_borda_points(scores, judge_result)
 
         # Return sorted by score (highest first)
-        return [provider for provider, _ in scores.most_common()]
+        return self._rank_by_score(scores)
+
+    @staticmethod
+    def _add_borda_points(scores: dict[Provider, int], judge_result: JudgeResult) -> None:
+        """Add one judge's Borda points to a running tally."""
+        rankings = judge_result.rankings
+        first = rankings.first_place.draft_source
+        scores[first] = scores.get(first, 0) + 3
+        if rankings.second_place is not None:
+            second = rankings.second_place.draft_source
+            scores[second] = scores.get(second, 0) + 2
+        if rankings.third_place is not None:
+            third = rankings.third_place.draft_source
+            scores[third] = scores.get(third, 0) + 1
+
+    @staticmethod
+    def _rank_by_score(scores: dict[Provider, int]) -> list[Provider]:
+        """
+        Order providers by score, highest first.
+
+        Ties keep first-seen order. With at most three providers an insertion
+        sort is a handful of comparisons.
+        """
+        ranked = list(scores)
+        for i in range(1, len(ranked)):
+            j = i
+            while j and scores[ranked[j]] > scores[ranked[j - 1]]:
+                ranked[j - 1], ranked[j] = ranked[j], ranked[j - 1]
+                j -= 1
+        return ranked
 
     def _get_recommended_edit(
         self,
@@ -504,32 +838,22 @@ class WritingPipeline:
         drafter_input: DrafterInput,
         drafting_phase: PhaseResult,
         started_at: datetime,
-        total_start: float,
+        total_time: float,
     ) -> PipelineResult:
         """Create a result for when drafting phase fails completely."""
-        total_time = (time.perf_counter() - total_start) * 1000
-
         return PipelineResult(
             original_input=drafter_input,
             drafting_phase=drafting_phase,
-            editing_phase=PhaseResult(
-                phase_name="editing",
-                successful={},
-                failed={},
-                execution_time_ms=0,
-            ),
-            judging_phase=PhaseResult(
-                phase_name="judging",
-                successful={},
-                failed={},
-                execution_time_ms=0,
-            ),
+            editing_phase=_EMPTY_EDITING_PHASE,
+            judging_phase=_EMPTY_JUDGING_PHASE,
             draft_results={},
             edit_results={},
             judge_results={},
+            total_tokens_used=drafting_phase.tokens_used,
+            total_cached_tokens=drafting_phase.cached_tokens,
             total_execution_time_ms=total_time,
             started_at=started_at,
-            completed_at=datetime.now(),
+            completed_at=started_at + timedelta(milliseconds=total_time),
         )
 
     def _create_partial_result(
@@ -539,27 +863,22 @@ class WritingPipeline:
         editing_phase: PhaseResult,
         draft_results: dict[Provider, DraftResult],
         started_at: datetime,
-        total_start: float,
+        total_time: float,
     ) -> PipelineResult:
         """Create a result for when editing phase fails completely."""
-        total_time = (time.perf_counter() - total_start) * 1000
-
         return PipelineResult(
             original_input=drafter_input,
             drafting_phase=drafting_phase,
             editing_phase=editing_phase,
-            judging_phase=PhaseResult(
-                phase_name="judging",
-                successful={},
-                failed={},
-                execution_time_ms=0,
-            ),
+            judging_phase=_EMPTY_JUDGING_PHASE,
             draft_results=draft_results,
             edit_results={},
             judge_results={},
+            total_tokens_used=drafting_phase.tokens_used + editing_phase.tokens_used,
+            total_cached_tokens=drafting_phase.cached_tokens + editing_phase.cached_tokens,
             total_execution_time_ms=total_time,
             started_at=started_at,
-            completed_at=datetime.now(),
+            completed_at=started_at + timedelta(milliseconds=total_time),
         )
 
     async def _query_cite_assist(
@@ -580,10 +899,11 @@ class WritingPipeline:
             List of LocalCitation objects
         """
         try:
-            async with CiteAssistClient(
-                base_url=self.cite_assist_url,
-                library_id=self.cite_assist_library_id,
-            ) as client:
+            async with contextlib.AsyncExitStack() as stack:
+                client = self._cite_client
+                if client is None:
+                    # Not used as a context manager: open a client for this query only
+                    client = await stack.enter_async_context(self._make_cite_client())
                 response = await client.search(
                     query=topic,
                     max_results=max_results,
@@ -592,23 +912,7 @@ class WritingPipeline:
                 )
 
                 # Convert to LocalCitation format
-                citations = []
-                for result in response.results:
-                    citations.append(
-                        LocalCitation(
-                            id=result.id,
-                            title=result.title,
-                            authors=result.authors,
-                            year=result.year,
-                            journal=result.journal,
-                            volume=result.volume,
-                            pages=result.pages,
-                            relevance_score=result.score,
-                            relevant_text=result.relevant_text,
-                        )
-                    )
-
-                return citations
+                return [LocalCitation.from_api_result(result) for result in response.results]
 
         except CiteAssistUnavailable as e:
             logger.warning(f"cite-assist unavailable: {e}")
@@ -617,9 +921,9 @@ class WritingPipeline:
             logger.warning(f"Error querying cite-assist: {e}")
             return []
 
-    def _load_sources(self, source_files: list[str]) -> list[LoadedSource]:
+    async def _load_sources(self, source_files: list[str]) -> list[LoadedSource]:
         """
-        Load source documents from paths and URLs.
+        Load source documents from paths and URLs concurrently.
 
         Args:
             source_files: List of file paths or URLs
@@ -628,7 +932,7 @@ class WritingPipeline:
             List of LoadedSource objects with content
         """
         loaded = []
-        docs = self.source_loader.load_many(source_files)
+        docs = await self.source_loader.load_many_async(source_files)
 
         for doc in docs:
             loaded.append(
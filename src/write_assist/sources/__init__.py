@@ -2,7 +2,12 @@
 Source document loading for local files and Google Docs.
 """
 
-from write_assist.sources.google_docs import extract_doc_id, is_google_doc_url, load_google_doc
+from write_assist.sources.google_docs import (
+    extract_doc_id,
+    is_google_doc_url,
+    load_google_doc,
+    load_google_docs_batch,
+)
 from write_assist.sources.loader import SourceLoader
 from write_assist.sources.local import is_local_path, load_local_file
 from write_assist.sources.models import (
@@ -25,6 +30,7 @@ __all__ = [
     "is_local_path",
     # Google Docs loading
     "load_google_doc",
+    "load_google_docs_batch",
     "is_google_doc_url",
     "extract_doc_id",
 ]
@@ -4,6 +4,8 @@ Google Docs loading for source documents.
 
 import logging
 import re
+import threading
+from collections.abc import Iterator
 from typing import Any
 
 from write_assist.sources.models import (
@@ -15,13 +17,18 @@ from write_assist.sources.models import (
 
 logger = logging.getLogger(__name__)
 
-# Google Docs URL patterns
-GOOGLE_DOC_PATTERNS = [
-    # Standard edit/view URLs
-    r"https?://docs\.google\.com/document/d/([a-zA-Z0-9_-]+)(?:/.*)?",
-    # Mobile URLs
-    r"https?://docs\.google\.com/document/u/\d+/d/([a-zA-Z0-9_-]+)(?:/.*)?",
-]
+# Service account credentials, shared by every thread once authenticated
+_docs_auth: Any | None = None
+_docs_auth_lock = threading.Lock()
+
+# Docs API services are not thread-safe (httplib2), so each thread builds its own
+_thread_local = threading.local()
+
+# Google Docs URL pattern: standard edit/view URLs and mobile (/u/<n>/) URLs
+GOOGLE_DOC_URL_RE = re.compile(r"https?://docs\.google\.com/document/(?:u/\d+/)?d/([a-zA-Z0-9_-]+)")
+
+# Literal prefix every match starts with; cheaper to rule out local paths with
+_GOOGLE_DOC_URL_PREFIXES = ("https://docs.google.com/document/", "http://docs.google.com/document/")
 
 
 def extract_doc_id(url: str) -> str | None:
@@ -34,11 +41,10 @@ def extract_doc_id(url: str) -> str | None:
     Returns:
         Document ID or None if not a valid Google Docs URL
     """
-    for pattern in GOOGLE_DOC_PATTERNS:
-        match = re.match(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    if not url.startswith(_GOOGLE_DOC_URL_PREFIXES):
+        return None
+    match = GOOGLE_DOC_URL_RE.match(url)
+    return match.group(1) if match else None
 
 
 def is_google_doc_url(url: str) -> bool:
@@ -46,6 +52,10 @@ def is_google_doc_url(url: str) -> bool:
     return extract_doc_id(url) is not None
 
 
+# Maximum requests per HTTP batch accepted by Google APIs
+MAX_BATCH_SIZE = 50
+
+
 def load_google_doc(url: str) -> SourceDocument:
     """
     Load a Google Doc as a source document.
@@ -67,6 +77,80 @@ def load_google_doc(url: str) -> SourceDocument:
     if not doc_id:
         raise SourceLoadError(url, "Invalid Google Docs URL")
 
+    docs_service = _build_docs_service(url)
+
+    try:
+        doc = docs_service.documents().get(documentId=doc_id).execute()
+    except Exception as e:
+        raise _load_error(url, e) from e
+
+    return _document_from_response(url, doc_id, doc)
+
+
+def load_google_docs_batch(urls: list[str]) -> dict[str, SourceDocument | SourceLoadError]:
+    """
+    Load several Google Docs with batched API requests.
+
+    All documents are fetched through one authenticated service, up to
+    MAX_BATCH_SIZE per HTTP round-trip, instead of one request each.
+
+    Args:
+        urls: Google Docs URLs
+
+    Returns:
+        Mapping of each URL to its SourceDocument, or to the SourceLoadError
+        that load_google_doc would have raised for it. URLs in a batch whose
+        transport failed are left out, so callers can load them one by one.
+
+    Raises:
+        GoogleDocsUnavailable: If Google Docs API is not available
+        SourceLoadError: If the Docs API service cannot be built
+    """
+    results: dict[str, SourceDocument | SourceLoadError] = {}
+    doc_ids: dict[str, str] = {}
+    for url in dict.fromkeys(urls):
+        doc_id = extract_doc_id(url)
+        if doc_id:
+            doc_ids[url] = doc_id
+        else:
+            results[url] = SourceLoadError(url, "Invalid Google Docs URL")
+
+    if not doc_ids:
+        return results
+
+    docs_service = _build_docs_service(next(iter(doc_ids)))
+
+    def on_response(url: str, doc: dict[str, Any] | None, error: Exception | None) -> None:
+        if error is not None:
+            results[url] = _load_error(url, error)
+        else:
+            results[url] = _document_from_response(url, doc_ids[url], doc or {})
+
+    pending = list(doc_ids.items())
+    for start in range(0, len(pending), MAX_BATCH_SIZE):
+        batch = docs_service.new_batch_http_request(callback=on_response)
+        for url, doc_id in pending[start : start + MAX_BATCH_SIZE]:
+            batch.add(docs_service.documents().get(documentId=doc_id), request_id=url)
+        try:
+            batch.execute()
+        except Exception as e:
+            # Transport failure: leave unanswered URLs out so each is retried on its own
+            logger.warning(f"Google Docs batch request failed, loading individually: {e}")
+
+    return results
+
+
+def _build_docs_service(url: str) -> Any:
+    """
+    Get an authenticated Docs API service, reporting failures against url.
+
+    Credentials are created once per process and the service once per thread,
+    so repeated loads skip the key read, token exchange and discovery fetch.
+    """
+    service = getattr(_thread_local, "docs_service", None)
+    if service is not None:
+        return service
+
     # Try to import auth-utils
     try:
         from auth_utils.google import GoogleServiceAccount
@@ -74,30 +158,14 @@ def load_google_doc(url: str) -> SourceDocument:
     except ImportError as e:
         raise GoogleDocsUnavailable(url, "auth-utils not installed: pip install auth-utils") from e
 
+    global _docs_auth
     try:
-        # Uses centralized credentials from auth-utils
-        auth = GoogleServiceAccount(scopes=["docs_readonly"])
-        docs_service = auth.build_service("docs", "v1")
-
-        # Fetch the document
-        doc = docs_service.documents().get(documentId=doc_id).execute()
-
-        # Extract text content
-        content = _extract_text_from_doc(doc)
-        title = doc.get("title", "Untitled Document")
-
-        return SourceDocument(
-            source_type=SourceType.GOOGLE_DOC,
-            path=url,
-            title=title,
-            content=content.strip(),
-            word_count=len(content.split()),
-            metadata={
-                "doc_id": doc_id,
-                "revision_id": doc.get("revisionId"),
-            },
-        )
-
+        with _docs_auth_lock:
+            if _docs_auth is None:
+                # Uses centralized credentials from auth-utils
+                _docs_auth = GoogleServiceAccount(scopes=["docs_readonly"])
+            auth = _docs_auth
+        service = auth.build_service("docs", "v1")
     except CredentialsNotFoundError as e:
         raise GoogleDocsUnavailable(
             url,
@@ -105,19 +173,45 @@ def load_google_doc(url: str) -> SourceDocument:
             "Run: auth-utils google import-key <path-to-key.json>",
         ) from e
     except Exception as e:
-        error_msg = str(e)
-        if "404" in error_msg:
-            raise SourceLoadError(
-                url,
-                "Document not found. Ensure the document exists and is shared "
-                "with the service account email.",
-            ) from e
-        if "403" in error_msg:
-            raise SourceLoadError(
-                url,
-                "Access denied. Share the document with the service account email.",
-            ) from e
-        raise SourceLoadError(url, f"Failed to load Google Doc: {e}") from e
+        raise _load_error(url, e) from e
+
+    _thread_local.docs_service = service
+    return service
+
+
+def _document_from_response(url: str, doc_id: str, doc: dict[str, Any]) -> SourceDocument:
+    """Build a SourceDocument from a documents.get response."""
+    content = _extract_text_from_doc(doc)
+    title = doc.get("title", "Untitled Document")
+
+    # Trusted, loader-built fields: construct without re-validating
+    return SourceDocument.model_construct(
+        source_type=SourceType.GOOGLE_DOC,
+        path=url,
+        title=title,
+        content=content.strip(),
+        metadata={
+            "doc_id": doc_id,
+            "revision_id": doc.get("revisionId"),
+        },
+    )
+
+
+def _load_error(url: str, error: Exception) -> SourceLoadError:
+    """Translate a Google API failure into a SourceLoadError with a helpful reason."""
+    error_msg = str(error)
+    if "404" in error_msg:
+        return SourceLoadError(
+            url,
+            "Document not found. Ensure the document exists and is shared "
+            "with the service account email.",
+        )
+    if "403" in error_msg:
+        return SourceLoadError(
+            url,
+            "Access denied. Share the document with the service account email.",
+        )
+    return SourceLoadError(url, f"Failed to load Google Doc: {error}")
 
 
 def _extract_text_from_doc(doc: dict[str, Any]) -> str:
@@ -130,56 +224,44 @@ def _extract_text_from_doc(doc: dict[str, Any]) -> str:
     Returns:
         Extracted text content
     """
-    content = doc.get("body", {}).get("content", [])
-    text_parts = []
+    return "\n\n".join(_iter_text_parts(doc))
+
 
-    for element in content:
+def _iter_text_parts(doc: dict[str, Any]) -> Iterator[str]:
+    """Yield the non-empty paragraph and table texts, in document order."""
+    for element in doc.get("body", {}).get("content", []):
         if "paragraph" in element:
-            paragraph_text = _extract_paragraph_text(element["paragraph"])
-            if paragraph_text:
-                text_parts.append(paragraph_text)
+            text = _extract_paragraph_text(element["paragraph"])
         elif "table" in element:
-            table_text = _extract_table_text(element["table"])
-            if table_text:
-                text_parts.append(table_text)
-
-    return "\n\n".join(text_parts)
+            text = _extract_table_text(element["table"])
+        else:
+            continue
+        if text:
+            yield text
 
 
 def _extract_paragraph_text(paragraph: dict[str, Any]) -> str:
     """Extract text from a paragraph element."""
-    elements = paragraph.get("elements", [])
-    text_parts = []
-
-    for elem in elements:
-        if "textRun" in elem:
-            text = elem["textRun"].get("content", "")
-            text_parts.append(text)
-
-    return "".join(text_parts).strip()
+    return "".join(
+        elem["textRun"].get("content", "")
+        for elem in paragraph.get("elements", [])
+        if "textRun" in elem
+    ).strip()
 
 
 def _extract_table_text(table: dict[str, Any]) -> str:
     """Extract text from a table element."""
-    rows = table.get("tableRows", [])
-    row_texts = []
-
-    for row in rows:
-        cells = row.get("tableCells", [])
-        cell_texts = []
-
-        for cell in cells:
-            cell_content = cell.get("content", [])
-            cell_text_parts = []
-
-            for element in cell_content:
-                if "paragraph" in element:
-                    para_text = _extract_paragraph_text(element["paragraph"])
-                    if para_text:
-                        cell_text_parts.append(para_text)
-
-            cell_texts.append(" ".join(cell_text_parts))
-
-        row_texts.append(" | ".join(cell_texts))
-
-    return "\n".join(row_texts)
+    return "\n".join(
+        " | ".join(_extract_cell_text(cell) for cell in row.get("tableCells", []))
+        for row in table.get("tableRows", [])
+    )
+
+
+def _extract_cell_text(cell: dict[str, Any]) -> str:
+    """Extract text from a table cell, one space between its paragraphs."""
+    paragraphs = (
+        _extract_paragraph_text(element["paragraph"])
+        for element in cell.get("content", [])
+        if "paragraph" in element
+    )
+    return " ".join(text for text in paragraphs if text)
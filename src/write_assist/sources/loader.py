@@ -2,11 +2,17 @@
 Main source document loader with auto-detection.
 """
 
+import asyncio
 import logging
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
-from write_assist.sources.google_docs import is_google_doc_url, load_google_doc
-from write_assist.sources.local import is_local_path, load_local_file
+from write_assist.sources.google_docs import (
+    is_google_doc_url,
+    load_google_doc,
+    load_google_docs_batch,
+)
+from write_assist.sources.local import clear_local_file_cache, is_local_path, load_local_file
 from write_assist.sources.models import (
     GoogleDocsUnavailable,
     SourceDocument,
@@ -16,6 +22,15 @@ from write_assist.sources.models import (
 
 logger = logging.getLogger(__name__)
 
+# Default cap on concurrent loads in load_many and load_many_async
+DEFAULT_MAX_CONCURRENT_LOADS = 8
+
+# Loader for each supported source type
+_LOADERS: dict[SourceType, Callable[[str], SourceDocument]] = {
+    SourceType.GOOGLE_DOC: load_google_doc,
+    SourceType.LOCAL_FILE: load_local_file,
+}
+
 
 class SourceLoader:
     """
@@ -58,12 +73,10 @@ class SourceLoader:
         """
         source_type = self.detect_type(path)
 
-        if source_type == SourceType.GOOGLE_DOC:
-            return load_google_doc(path)
-        elif source_type == SourceType.LOCAL_FILE:
-            return load_local_file(path)
-        else:
+        load_fn = _LOADERS.get(source_type)
+        if load_fn is None:
             raise SourceLoadError(path, f"Unsupported source type: {source_type}")
+        return load_fn(path)
 
     def load_many(
         self,
@@ -73,43 +86,116 @@ class SourceLoader:
         """
         Load multiple source documents.
 
+        Google Docs are fetched together in batched API requests; the
+        remaining loads run on a small thread pool, so file reads overlap.
+        on_progress may be called from those threads.
+
         Args:
             paths: List of paths or URLs
             on_progress: Optional callback (path, success) for progress
 
         Returns:
-            List of successfully loaded documents
+            List of successfully loaded documents, in the order of paths
+        """
+        prefetched = self._prefetch_google_docs(paths)
+
+        if len(paths) <= 1:
+            documents = [self._load_one(path, on_progress, prefetched) for path in paths]
+        else:
+            workers = min(DEFAULT_MAX_CONCURRENT_LOADS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                documents = list(
+                    pool.map(lambda path: self._load_one(path, on_progress, prefetched), paths)
+                )
+
+        return [doc for doc in documents if doc is not None]
+
+    async def load_many_async(
+        self,
+        paths: list[str],
+        on_progress: Callable[[str, bool], None] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_LOADS,
+    ) -> list[SourceDocument]:
         """
-        documents = []
+        Load multiple source documents concurrently.
 
-        for path in paths:
-            try:
+        Google Docs are fetched together in batched API requests, and each
+        remaining load runs in a worker thread, so file reads overlap
+        instead of running back to back.
+
+        Args:
+            paths: List of paths or URLs
+            on_progress: Optional callback (path, success) for progress
+            max_concurrency: Maximum loads in flight at once
+
+        Returns:
+            List of successfully loaded documents, in the order of paths
+        """
+        prefetched = await asyncio.to_thread(self._prefetch_google_docs, paths)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def load_one(path: str) -> SourceDocument | None:
+            async with semaphore:
+                return await asyncio.to_thread(self._load_one, path, on_progress, prefetched)
+
+        documents = await asyncio.gather(*[load_one(path) for path in paths])
+        return [doc for doc in documents if doc is not None]
+
+    def _load_one(
+        self,
+        path: str,
+        on_progress: Callable[[str, bool], None] | None = None,
+        prefetched: dict[str, SourceDocument | SourceLoadError] | None = None,
+    ) -> SourceDocument | None:
+        """Load one document, applying the on_error strategy to failures."""
+        try:
+            doc = prefetched.get(path) if prefetched else None
+            if isinstance(doc, SourceLoadError):
+                raise doc
+            if doc is None:
                 doc = self.load(path)
-                documents.append(doc)
-                if on_progress:
-                    on_progress(path, True)
+            if on_progress:
+                on_progress(path, True)
+            return doc
 
-            except SourceLoadError as e:
-                if on_progress:
-                    on_progress(path, False)
+        except SourceLoadError as e:
+            if on_progress:
+                on_progress(path, False)
 
-                if self.on_error == "raise":
-                    raise
-                elif self.on_error == "warn":
-                    logger.warning(f"Failed to load source: {e}")
-                # "skip" - silently continue
+            if self.on_error == "raise":
+                raise
+            elif self.on_error == "warn":
+                logger.warning(f"Failed to load source: {e}")
+            # "skip" - silently continue
 
-            except GoogleDocsUnavailable as e:
-                if on_progress:
-                    on_progress(path, False)
+        except GoogleDocsUnavailable as e:
+            if on_progress:
+                on_progress(path, False)
 
-                if self.on_error == "raise":
-                    raise
-                elif self.on_error == "warn":
-                    logger.warning(f"Google Docs unavailable: {e}")
-                # "skip" - silently continue
+            if self.on_error == "raise":
+                raise
+            elif self.on_error == "warn":
+                logger.warning(f"Google Docs unavailable: {e}")
+            # "skip" - silently continue
 
-        return documents
+        return None
+
+    @staticmethod
+    def _prefetch_google_docs(paths: list[str]) -> dict[str, SourceDocument | SourceLoadError]:
+        """
+        Fetch every Google Doc in paths with batched requests.
+
+        Returns an empty mapping when there are fewer than two docs or the
+        Docs API is unavailable. Paths missing from the mapping, including
+        those in a batch that failed in transit, then load one by one.
+        """
+        urls = [path for path in paths if is_google_doc_url(path)]
+        if len(urls) < 2:
+            return {}
+        try:
+            return load_google_docs_batch(urls)
+        except SourceLoadError:
+            return {}
 
     @staticmethod
     def detect_type(path: str) -> SourceType:
@@ -129,6 +215,11 @@ class SourceLoader:
         else:
             return SourceType.URL
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached local files so the next load re-reads them from disk."""
+        clear_local_file_cache()
+
     def load_safe(self, path: str) -> SourceDocument | None:
         """
         Load a source document, returning None on error.
@@ -3,8 +3,12 @@ Local file loading for source documents.
 """
 
 import logging
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
+from stat import S_ISREG
 
+from write_assist.caching import get_source_cache
 from write_assist.sources.models import SourceDocument, SourceLoadError, SourceType
 
 logger = logging.getLogger(__name__)
@@ -12,6 +16,17 @@ logger = logging.getLogger(__name__)
 # Supported file extensions
 SUPPORTED_TEXT_EXTENSIONS = {".txt", ".md", ".markdown", ".rst", ".text"}
 
+# Parsed files kept in memory, keyed by path, mtime and size
+MAX_CACHED_FILES = 128
+
+# Formats worth keeping in the on-disk cache; text files are as cheap to re-read
+PERSISTENT_CACHE_EXTENSIONS = {".pdf", ".docx", ".doc"}
+
+# Optional parsers, checked once; a failed import is not cached and would
+# search sys.path again for every file
+HAS_PYPDF = find_spec("pypdf") is not None
+HAS_PYTHON_DOCX = find_spec("docx") is not None
+
 
 def load_local_file(path: str) -> SourceDocument:
     """
@@ -26,36 +41,75 @@ def load_local_file(path: str) -> SourceDocument:
     Raises:
         SourceLoadError: If file cannot be loaded
     """
-    file_path = Path(path).expanduser().resolve()
-
-    if not file_path.exists():
-        raise SourceLoadError(path, "File not found")
+    # A strict resolve doubles as the existence check, and one stat covers
+    # the file-type check and the cache key
+    try:
+        file_path = Path(path).expanduser().resolve(strict=True)
+        file_stat = file_path.stat()
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise SourceLoadError(path, "File not found") from e
 
-    if not file_path.is_file():
+    if not S_ISREG(file_stat.st_mode):
         raise SourceLoadError(path, "Path is not a file")
 
+    # Reuse the parsed document while the file is unchanged; hand out a copy
+    # so callers can't alter the cached one
+    doc = _load_file_cached(file_path, path, file_stat.st_mtime_ns, file_stat.st_size)
+    return doc.model_copy(deep=True)
+
+
+@lru_cache(maxsize=MAX_CACHED_FILES)
+def _load_file_cached(file_path: Path, path: str, mtime_ns: int, size: int) -> SourceDocument:
+    """
+    Load a parsed file; mtime_ns and size key the caches so edits are re-read.
+
+    Misses in memory fall back to the on-disk source cache for PDF and Word
+    files before parsing.
+    """
+    if file_path.suffix.lower() not in PERSISTENT_CACHE_EXTENSIONS:
+        return _parse_file(file_path, path, size)
+
+    source_cache = get_source_cache()
+    key = source_cache.make_key(file_path, path, mtime_ns, size)
+    cached = source_cache.get(key)
+    if cached is not None:
+        return SourceDocument.model_validate_json(cached)
+
+    doc = _parse_file(file_path, path, size)
+    source_cache.set(key, doc.model_dump_json())
+    return doc
+
+
+def _parse_file(file_path: Path, path: str, size: int) -> SourceDocument:
+    """Parse a file by type."""
     ext = file_path.suffix.lower()
 
     # Text-based files
     if ext in SUPPORTED_TEXT_EXTENSIONS:
-        return _load_text_file(file_path, path)
+        return _load_text_file(file_path, path, size)
 
     # PDF files
     if ext == ".pdf":
-        return _load_pdf_file(file_path, path)
+        return _load_pdf_file(file_path, path, size)
 
     # Word documents
     if ext in {".docx", ".doc"}:
-        return _load_docx_file(file_path, path)
+        return _load_docx_file(file_path, path, size)
 
     # Fallback: try to read as text
     try:
-        return _load_text_file(file_path, path)
+        return _load_text_file(file_path, path, size)
     except UnicodeDecodeError as e:
         raise SourceLoadError(path, f"Unsupported file format: {ext}") from e
 
 
-def _load_text_file(file_path: Path, original_path: str) -> SourceDocument:
+def clear_local_file_cache() -> None:
+    """Drop all cached parsed files, in memory and on disk."""
+    _load_file_cached.cache_clear()
+    get_source_cache().clear()
+
+
+def _load_text_file(file_path: Path, original_path: str, size_bytes: int) -> SourceDocument:
     """Load a plain text file."""
     try:
         content = file_path.read_text(encoding="utf-8")
@@ -63,27 +117,27 @@ def _load_text_file(file_path: Path, original_path: str) -> SourceDocument:
         # Try with latin-1 as fallback
         content = file_path.read_text(encoding="latin-1")
 
-    return SourceDocument(
+    # Fields are built here with the right types, so skip validation
+    return SourceDocument.model_construct(
         source_type=SourceType.LOCAL_FILE,
         path=original_path,
         title=file_path.stem,
         content=content.strip(),
-        word_count=len(content.split()),
         metadata={
             "extension": file_path.suffix,
-            "size_bytes": file_path.stat().st_size,
+            "size_bytes": size_bytes,
         },
     )
 
 
-def _load_pdf_file(file_path: Path, original_path: str) -> SourceDocument:
+def _load_pdf_file(file_path: Path, original_path: str, size_bytes: int) -> SourceDocument:
     """Load a PDF file (requires pypdf)."""
-    try:
-        from pypdf import PdfReader
-    except ImportError as e:
+    if not HAS_PYPDF:
         raise SourceLoadError(
             original_path, "PDF support requires 'pypdf' package: pip install pypdf"
-        ) from e
+        )
+
+    from pypdf import PdfReader
 
     try:
         reader = PdfReader(file_path)
@@ -95,47 +149,46 @@ def _load_pdf_file(file_path: Path, original_path: str) -> SourceDocument:
 
         content = "\n\n".join(pages)
 
-        return SourceDocument(
+        return SourceDocument.model_construct(
             source_type=SourceType.LOCAL_FILE,
             path=original_path,
             title=file_path.stem,
             content=content.strip(),
-            word_count=len(content.split()),
             metadata={
                 "extension": ".pdf",
                 "page_count": len(reader.pages),
-                "size_bytes": file_path.stat().st_size,
+                "size_bytes": size_bytes,
             },
         )
     except Exception as e:
         raise SourceLoadError(original_path, f"Failed to read PDF: {e}") from e
 
 
-def _load_docx_file(file_path: Path, original_path: str) -> SourceDocument:
+def _load_docx_file(file_path: Path, original_path: str, size_bytes: int) -> SourceDocument:
     """Load a Word document (requires python-docx)."""
-    try:
-        from docx import Document
-    except ImportError as e:
+    if not HAS_PYTHON_DOCX:
         raise SourceLoadError(
             original_path,
             "Word document support requires 'python-docx' package: pip install python-docx",
-        ) from e
+        )
+
+    from docx import Document
 
     try:
         doc = Document(file_path)
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+        # Paragraph.text is rebuilt from its runs on every access, so read it once
+        paragraphs = [text for text in (p.text for p in doc.paragraphs) if text.strip()]
         content = "\n\n".join(paragraphs)
 
-        return SourceDocument(
+        return SourceDocument.model_construct(
             source_type=SourceType.LOCAL_FILE,
             path=original_path,
             title=file_path.stem,
             content=content.strip(),
-            word_count=len(content.split()),
             metadata={
                 "extension": file_path.suffix,
                 "paragraph_count": len(paragraphs),
-                "size_bytes": file_path.stat().st_size,
+                "size_bytes": size_bytes,
             },
         )
     except Exception as e:
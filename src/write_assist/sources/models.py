@@ -2,13 +2,38 @@
 Models for source document loading.
 """
 
-from enum import Enum
+from enum import StrEnum
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
+# Characters split at a time by count_words; bounds the temporary word list
+_COUNT_CHUNK_CHARS = 1 << 16
 
-class SourceType(str, Enum):
+# Characters of content shown by SourceDocument.preview
+PREVIEW_CHARS = 200
+
+
+def count_words(text: str, chunk_chars: int = _COUNT_CHUNK_CHARS) -> int:
+    """
+    Count whitespace-separated words, as len(text.split()) would.
+
+    Splits the text a chunk at a time, so a multi-megabyte document never
+    materializes its full word list, while staying on str.split's C loop.
+    """
+    count = 0
+    word_open = False  # Previous chunk ended mid-word
+    for start in range(0, len(text), chunk_chars):
+        chunk = text[start : start + chunk_chars]
+        count += len(chunk.split())
+        if word_open and not chunk[0].isspace():
+            count -= 1  # Same word as the end of the previous chunk
+        word_open = not chunk[-1].isspace()
+    return count
+
+
+class SourceType(StrEnum):
     """Type of source document."""
 
     LOCAL_FILE = "local_file"
@@ -23,15 +48,20 @@ class SourceDocument(BaseModel):
     path: str = Field(..., description="Original path or URL")
     title: str = Field(..., description="Document title")
     content: str = Field(..., description="Extracted text content")
-    word_count: int = Field(default=0, description="Approximate word count")
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    @property
+    @computed_field(description="Word count")  # type: ignore[prop-decorator]
+    @cached_property
+    def word_count(self) -> int:
+        """Count words on first access; most documents are never asked."""
+        return count_words(self.content)
+
+    @cached_property
     def preview(self) -> str:
-        """Get a preview of the content (first 200 chars)."""
-        if len(self.content) <= 200:
+        """Get a preview of the content (first 200 chars), built on first access."""
+        if len(self.content) <= PREVIEW_CHARS:
             return self.content
-        return self.content[:200] + "..."
+        return self.content[:PREVIEW_CHARS] + "..."
 
 
 class SourceLoadError(Exception):
@@ -3,7 +3,7 @@ Base class for agent tools.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
@@ -15,15 +15,28 @@ class BaseTool(ABC):
     description: str
     input_model: type[BaseModel]
 
+    # Generated schemas, shared by every tool instance with the same definition
+    _schema_cache: ClassVar[dict[tuple[str, str, type[BaseModel]], dict[str, Any]]] = {}
+
     @abstractmethod
     def run(self, **kwargs: Any) -> Any:
         """Execute the tool."""
         pass
 
     def to_schema(self) -> dict[str, Any]:
-        """Convert tool to JSON schema for the LLM."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "parameters": self.input_model.model_json_schema(),
-        }
+        """
+        Convert tool to JSON schema for the LLM.
+
+        The schema is generated once per tool definition and shared; treat
+        the returned dict as read-only.
+        """
+        key = (self.name, self.description, self.input_model)
+        schema = BaseTool._schema_cache.get(key)
+        if schema is None:
+            schema = {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.input_model.model_json_schema(),
+            }
+            BaseTool._schema_cache[key] = schema
+        return schema
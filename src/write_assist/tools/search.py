@@ -7,9 +7,20 @@ from typing import Any
 
 from googleapiclient.discovery import build
 from pydantic import BaseModel, Field
+from pydantic_core import from_json
 
+from write_assist.http import get_async_client
 from write_assist.tools.base import BaseTool
 
+# Custom Search JSON API endpoint (used by the async path)
+CSE_URL = "https://www.googleapis.com/customsearch/v1"
+
+# API max results per request
+MAX_RESULTS_PER_REQUEST = 10
+
+# Snippets are flattened onto one line
+_NEWLINES_TO_SPACES = str.maketrans({"\n": " "})
+
 
 class SearchInput(BaseModel):
     """Input for search tool."""
@@ -29,6 +40,15 @@ class SearchTool(BaseTool):
         """Initialize the search tool."""
         self._api_key = api_key or os.environ.get("GOOGLE_API_KEY")
         self._cse_id = cse_id or os.environ.get("GOOGLE_CSE_ID")
+        self._service: Any | None = None
+
+    def _get_service(self) -> Any:
+        """Build the Custom Search service once and reuse it (and its connection)."""
+        if self._service is None:
+            self._service = build(
+                "customsearch", "v1", developerKey=self._api_key, cache_discovery=False
+            )
+        return self._service
 
     def run(self, query: str, max_results: int = 5) -> str | list[dict[str, Any]]:
         """
@@ -41,32 +61,63 @@ class SearchTool(BaseTool):
             return "Error: GOOGLE_API_KEY and GOOGLE_CSE_ID must be set."
 
         try:
-            service = build("customsearch", "v1", developerKey=self._api_key)
+            service = self._get_service()
             result = (
                 service.cse()
                 .list(
                     q=query,
                     cx=self._cse_id,
-                    num=min(max_results, 10),  # API max is 10
+                    num=min(max_results, MAX_RESULTS_PER_REQUEST),
                 )
                 .execute()
             )
+            return self._format_results(query, result)
+
+        except Exception as e:
+            return f"Error executing search: {str(e)}"
 
-            # Format results into a readable string for the LLM
-            output = [f"Search results for: {query}\n"]
+    async def run_async(self, query: str, max_results: int = 5) -> str:
+        """
+        Execute the search without blocking the event loop.
 
-            items = result.get("items", [])
-            if not items:
-                return "No results found."
+        Calls the Custom Search REST endpoint through the shared HTTP
+        client, reusing its pooled connections.
 
-            for i, item in enumerate(items, 1):
-                output.append(f"Source {i}: {item.get('title')}")
-                output.append(f"URL: {item.get('link')}")
-                snippet = item.get("snippet", "").replace("\n", " ")
-                output.append(f"Snippet: {snippet}")
-                output.append("")  # Empty line
+        Returns:
+            Formatted string of search results or string error message.
+        """
+        if not self._api_key or not self._cse_id:
+            return "Error: GOOGLE_API_KEY and GOOGLE_CSE_ID must be set."
 
-            return "\n".join(output)
+        params = {
+            "q": query,
+            "cx": self._cse_id,
+            "key": self._api_key,
+            "num": min(max_results, MAX_RESULTS_PER_REQUEST),
+        }
+        try:
+            response = await get_async_client().get(CSE_URL, params=params)
+            response.raise_for_status()
+            # pydantic's Rust parser reads the raw bytes faster than stdlib json
+            return self._format_results(query, from_json(response.content))
 
         except Exception as e:
             return f"Error executing search: {str(e)}"
+
+    @staticmethod
+    def _format_results(query: str, result: dict[str, Any]) -> str:
+        """Format search results into a readable string for the LLM."""
+        items = result.get("items", [])
+        if not items:
+            return "No results found."
+
+        # One block per item, each ending in a newline so blocks are blank-line separated
+        output = [f"Search results for: {query}\n"]
+        output.extend(
+            f"Source {i}: {item.get('title')}\n"
+            f"URL: {item.get('link')}\n"
+            f"Snippet: {(item.get('snippet') or '').translate(_NEWLINES_TO_SPACES)}\n"
+            for i, item in enumerate(items, 1)
+        )
+
+        return "\n".join(output)
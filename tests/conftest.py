@@ -0,0 +1,37 @@
+"""
+Shared pytest configuration.
+"""
+
+import os
+import sys
+from collections.abc import Callable
+from importlib.util import find_spec
+from pathlib import Path
+
+import pytest
+
+# RAM-backed filesystem on Linux; the artifact tests write many small files
+RAMDISK = Path("/dev/shm")
+
+# Optional faster event loop for async tests (not available on Windows)
+HAS_UVLOOP = sys.platform != "win32" and find_spec("uvloop") is not None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Put tmp_path directories on a ramdisk unless --basetemp was given."""
+    if config.option.basetemp or not sys.platform.startswith("linux"):
+        return
+    if not (RAMDISK.is_dir() and os.access(RAMDISK, os.W_OK)):
+        return
+    # Move pytest's temp root rather than fixing --basetemp, which pytest wipes
+    # at startup; its numbered per-session directories keep concurrent runs apart
+    os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(RAMDISK))
+
+
+if HAS_UVLOOP:
+    import uvloop
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories() -> dict[str, Callable[[], object]]:
+        """Run async tests and fixtures on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
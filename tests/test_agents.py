@@ -5,10 +5,12 @@ These tests make REAL API calls - no mocks.
 Requires valid API keys in environment variables.
 """
 
+import asyncio
 import os
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
 from write_assist.agents import (
     DrafterAgent,
@@ -18,6 +20,7 @@ from write_assist.agents import (
     EditorInput,
     EditResult,
     JudgeAgent,
+    JudgeInput,
     ParallelRunResult,
 )
 
@@ -27,25 +30,31 @@ def has_api_key(env_var: str) -> bool:
     return bool(os.environ.get(env_var))
 
 
+# Providers and the API key each one needs
+PROVIDER_API_KEYS = {
+    "claude": "ANTHROPIC_API_KEY",
+    "gemini": "GOOGLE_API_KEY",
+    "chatgpt": "OPENAI_API_KEY",
+}
+
+# Keys present at import; tests that unset keys can't change which tests run
+KEYS_PRESENT = {env_var: has_api_key(env_var) for env_var in PROVIDER_API_KEYS.values()}
+
 # Skip markers
 skip_no_anthropic = pytest.mark.skipif(
-    not has_api_key("ANTHROPIC_API_KEY"),
+    not KEYS_PRESENT["ANTHROPIC_API_KEY"],
     reason="ANTHROPIC_API_KEY not set",
 )
 skip_no_google = pytest.mark.skipif(
-    not has_api_key("GOOGLE_API_KEY"),
+    not KEYS_PRESENT["GOOGLE_API_KEY"],
     reason="GOOGLE_API_KEY not set",
 )
 skip_no_openai = pytest.mark.skipif(
-    not has_api_key("OPENAI_API_KEY"),
+    not KEYS_PRESENT["OPENAI_API_KEY"],
     reason="OPENAI_API_KEY not set",
 )
 skip_no_all_keys = pytest.mark.skipif(
-    not (
-        has_api_key("ANTHROPIC_API_KEY")
-        and has_api_key("GOOGLE_API_KEY")
-        and has_api_key("OPENAI_API_KEY")
-    ),
+    not all(KEYS_PRESENT.values()),
     reason="Not all API keys are set",
 )
 
@@ -55,10 +64,8 @@ skip_no_all_keys = pytest.mark.skipif(
 # =============================================================================
 
 
-@pytest.fixture
-def project_root() -> Path:
-    """Get the project root directory."""
-    # Find the project root by looking for .claude directory
+def _find_project_root() -> Path:
+    """Find the project root by looking for .claude directory."""
     current = Path(__file__).parent
     for parent in [current, *current.parents]:
         if (parent / ".claude").is_dir():
@@ -66,9 +73,12 @@ def project_root() -> Path:
     return current.parent
 
 
-@pytest.fixture
-def sample_drafter_input() -> DrafterInput:
-    """Sample input for drafter tests."""
+# Found once; the tree doesn't move during a test run
+PROJECT_ROOT = _find_project_root()
+
+
+def _make_drafter_input() -> DrafterInput:
+    """Build the sample drafter input."""
     return DrafterInput(
         topic="The doctrine of consideration in contract law",
         document_type="article",
@@ -82,6 +92,36 @@ def sample_drafter_input() -> DrafterInput:
     )
 
 
+@pytest.fixture(scope="session")
+def project_root() -> Path:
+    """Get the project root directory."""
+    return PROJECT_ROOT
+
+
+@pytest.fixture
+def sample_drafter_input() -> DrafterInput:
+    """Sample input for drafter tests."""
+    return _make_drafter_input()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def provider_drafts() -> dict[str, DraftResult | BaseException]:
+    """
+    Draft once per provider with an API key, concurrently, for the whole module.
+
+    The calls overlap, so the suite waits for the slowest provider rather
+    than the sum of all three. Failures are returned, not raised.
+    """
+    agent = DrafterAgent(project_root=PROJECT_ROOT)
+    inputs = _make_drafter_input()
+    providers = [p for p, env_var in PROVIDER_API_KEYS.items() if KEYS_PRESENT[env_var]]
+    results = await asyncio.gather(
+        *[agent.run(inputs=inputs, provider=p, max_tokens=2000) for p in providers],
+        return_exceptions=True,
+    )
+    return dict(zip(providers, results, strict=True))
+
+
 @pytest.fixture
 def sample_draft_result() -> DraftResult:
     """Sample draft result for editor tests."""
@@ -117,6 +157,64 @@ def sample_draft_result() -> DraftResult:
     )
 
 
+def _make_edit_result(provider: str) -> EditResult:
+    """Build a minimal edit result from the given provider's editor."""
+    from write_assist.agents.models import (
+        AgentMetadata,
+        IntegratedDraft,
+        IntegrationNotes,
+        QualityAssessment,
+    )
+
+    return EditResult(
+        integrated_draft=IntegratedDraft(title="Consideration", content="...", word_count=1),
+        integration_notes=IntegrationNotes(),
+        quality_assessment=QualityAssessment(
+            argument_strength="Good",
+            citation_accuracy="Good",
+            prose_quality="Good",
+            structural_coherence="Good",
+        ),
+        metadata=AgentMetadata(model="test", provider=provider),
+    )
+
+
+def _make_judgment(ranked: list[str], scored: list[str] | None = None) -> str:
+    """Build a raw judge response ranking and scoring the given providers."""
+    import json
+
+    places = ["first_place", "second_place", "third_place"]
+    score = {"score": 8, "explanation": "..."}
+    dimensions = [
+        "argument_strength",
+        "citation_quality",
+        "prose_clarity",
+        "structural_coherence",
+        "academic_rigor",
+        "originality",
+    ]
+    return json.dumps(
+        {
+            "rankings": {
+                place: {"draft_source": provider, "overall_score": 8.0, "summary": "..."}
+                for place, provider in zip(places, ranked)
+            },
+            "detailed_scores": {
+                f"{provider}_edit": dict.fromkeys(dimensions, score)
+                for provider in (ranked if scored is None else scored)
+            },
+            "comparative_analysis": {
+                "strongest_arguments": "...",
+                "best_citations": "...",
+                "clearest_prose": "...",
+                "most_original": "...",
+            },
+            "recommendations": {},
+            "metadata": {"model": "test"},
+        }
+    )
+
+
 # =============================================================================
 # Basic Agent Tests (No API calls)
 # =============================================================================
@@ -178,6 +276,142 @@ class TestAgentBasics:
                 section_outline="Outline",
             )
 
+    def test_parse_json_response_fenced(self, project_root: Path, sample_draft_result: DraftResult):
+        """Should parse a fenced JSON response and stamp the provider."""
+        agent = DrafterAgent(project_root=project_root)
+        raw = f"```json\n{sample_draft_result.model_dump_json()}\n```"
+
+        result = agent.parse_json_response(raw, "gemini")
+
+        assert result.draft.title == sample_draft_result.draft.title
+        assert result.metadata.provider == "gemini"
+
+    def test_parse_json_response_invalid(self, project_root: Path):
+        """Should raise ValueError for malformed JSON."""
+        agent = DrafterAgent(project_root=project_root)
+        with pytest.raises(ValueError, match="Failed to parse JSON"):
+            agent.parse_json_response('{"draft": ', "claude")
+
+    def test_editor_prompt_reused_for_same_inputs(
+        self,
+        project_root: Path,
+        sample_drafter_input: DrafterInput,
+        sample_draft_result: DraftResult,
+    ):
+        """Should build the editor prompt once per inputs object."""
+        agent = EditorAgent(project_root=project_root)
+        editor_input = EditorInput(
+            drafts=[sample_draft_result],
+            providers=["claude"],
+            original_context=sample_drafter_input,
+        )
+
+        prompt = agent._get_prompt(editor_input)
+
+        assert agent._get_prompt(editor_input) is prompt
+        assert agent._get_prompt(editor_input.model_copy()) is not prompt
+
+    def test_editor_labels_drafts_by_given_providers(
+        self,
+        project_root: Path,
+        sample_drafter_input: DrafterInput,
+        sample_draft_result: DraftResult,
+    ):
+        """Should label drafts by the providers passed in, not the LLM-reported metadata."""
+        agent = EditorAgent(project_root=project_root)
+        editor_input = EditorInput(
+            drafts=[sample_draft_result],
+            providers=["gemini"],
+            original_context=sample_drafter_input,
+        )
+
+        assert "### Draft A (Gemini)" in agent.build_prompt(editor_input)
+
+        # Without explicit providers, labels fall back to the drafts' metadata
+        derived = EditorInput(drafts=[sample_draft_result], original_context=sample_drafter_input)
+        assert derived.providers == ["claude"]
+
+        with pytest.raises(ValueError, match="one distinct provider per draft"):
+            EditorInput(
+                drafts=[sample_draft_result, sample_draft_result],
+                providers=["claude", "claude"],
+                original_context=sample_drafter_input,
+            )
+
+    def test_failing_result_callback_is_logged_not_raised(
+        self, project_root: Path, caplog: pytest.LogCaptureFixture
+    ):
+        """Should keep a raising on_result listener from aborting the other providers."""
+        agent = DrafterAgent(project_root=project_root)
+
+        def on_result(provider: str, result: object) -> None:
+            raise RuntimeError(f"listener bug ({provider}: {result})")
+
+        agent._report_result(on_result, "claude", None)
+
+        assert "listener bug" in caplog.text
+
+    def test_local_citation_from_api_result(self):
+        """Should convert a cite-assist search result into a LocalCitation."""
+        from write_assist.agents.models import LocalCitation
+        from write_assist.citations import CitationResult
+
+        result = CitationResult(
+            id="abc123",
+            title="Test Article",
+            score=0.85,
+            summary="Summary text.",
+            authors=["Jane Smith"],
+            year=2020,
+        )
+        citation = LocalCitation.from_api_result(result)
+
+        assert citation.id == "abc123"
+        assert citation.relevance_score == 0.85
+        assert citation.relevant_text == "Summary text."
+        assert citation.authors == ["Jane Smith"]
+        assert citation.model_dump()["year"] == 2020
+
+    def test_judge_output_examples_match_judged_providers(self):
+        """Should only ask the judge to rank the drafts it was given."""
+        rankings, scores = JudgeAgent._format_output_examples(["claude", "gemini"])
+
+        assert '"second_place"' in rankings
+        assert '"third_place"' not in rankings
+        assert '"draft_source": "claude | gemini"' in rankings
+        assert '"gemini_edit"' in scores
+        assert '"chatgpt_edit"' not in scores
+
+    def test_judge_labels_and_validates_by_given_providers(
+        self, project_root: Path, sample_drafter_input: DrafterInput
+    ):
+        """Should label by the given providers and reject judgments that skip one."""
+        judge_input = JudgeInput(
+            # Every editor reported itself as Claude; labels come from providers
+            integrated_drafts=[_make_edit_result("claude")] * 3,
+            providers=["claude", "gemini", "chatgpt"],
+            original_context=sample_drafter_input,
+        )
+        agent = JudgeAgent(project_root=project_root)
+        assert "(from Gemini Editor)" in agent.build_prompt(judge_input)
+
+        # Without explicit providers, labels fall back to the edits' metadata
+        derived = JudgeInput(
+            integrated_drafts=[_make_edit_result("gemini")],
+            original_context=sample_drafter_input,
+        )
+        assert derived.providers == ["gemini"]
+
+        complete = _make_judgment(["gemini", "claude", "chatgpt"])
+        result = agent.parse_json_response(complete, "claude", judge_input)
+        assert [e.draft_source for e in result.rankings.places()] == ["gemini", "claude", "chatgpt"]
+
+        with pytest.raises(ValueError, match="rankings must place"):
+            agent.parse_json_response(_make_judgment(["gemini"]), "claude", judge_input)
+        with pytest.raises(ValueError, match="detailed_scores missing"):
+            unscored = _make_judgment(["gemini", "claude", "chatgpt"], scored=["gemini"])
+            agent.parse_json_response(unscored, "claude", judge_input)
+
 
 # =============================================================================
 # Drafter Agent Integration Tests
@@ -189,48 +423,31 @@ class TestDrafterIntegration:
     """Integration tests for the drafter agent."""
 
     @skip_no_anthropic
-    async def test_drafter_run_claude(self, project_root: Path, sample_drafter_input: DrafterInput):
+    async def test_drafter_run_claude(self, provider_drafts: dict):
         """Should run drafter on Claude and return valid result."""
-        agent = DrafterAgent(project_root=project_root)
-        result = await agent.run(
-            inputs=sample_drafter_input,
-            provider="claude",
-            max_tokens=2000,
-        )
+        result = provider_drafts["claude"]
 
-        assert isinstance(result, DraftResult)
+        assert isinstance(result, DraftResult), result
         assert result.draft.title
         assert result.draft.content
         assert result.draft.word_count > 0
         assert result.metadata.provider == "claude"
 
     @skip_no_google
-    async def test_drafter_run_gemini(self, project_root: Path, sample_drafter_input: DrafterInput):
+    async def test_drafter_run_gemini(self, provider_drafts: dict):
         """Should run drafter on Gemini and return valid result."""
-        agent = DrafterAgent(project_root=project_root)
-        result = await agent.run(
-            inputs=sample_drafter_input,
-            provider="gemini",
-            max_tokens=2000,
-        )
+        result = provider_drafts["gemini"]
 
-        assert isinstance(result, DraftResult)
+        assert isinstance(result, DraftResult), result
         assert result.draft.title
         assert result.metadata.provider == "gemini"
 
     @skip_no_openai
-    async def test_drafter_run_chatgpt(
-        self, project_root: Path, sample_drafter_input: DrafterInput
-    ):
+    async def test_drafter_run_chatgpt(self, provider_drafts: dict):
         """Should run drafter on ChatGPT and return valid result."""
-        agent = DrafterAgent(project_root=project_root)
-        result = await agent.run(
-            inputs=sample_drafter_input,
-            provider="chatgpt",
-            max_tokens=2000,
-        )
+        result = provider_drafts["chatgpt"]
 
-        assert isinstance(result, DraftResult)
+        assert isinstance(result, DraftResult), result
         assert result.draft.title
         assert result.metadata.provider == "chatgpt"
 
@@ -283,6 +500,7 @@ class TestEditorIntegration:
 
         editor_input = EditorInput(
             drafts=drafts,
+            providers=["claude", "gemini", "chatgpt"],
             original_context=sample_drafter_input,
         )
 
@@ -307,34 +525,44 @@ class TestEditorIntegration:
 class TestErrorHandling:
     """Tests for error handling."""
 
+    @pytest.fixture
+    def no_api_keys(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Unset every provider key for one test; pytest restores them afterwards."""
+        for env_var in PROVIDER_API_KEYS.values():
+            monkeypatch.delenv(env_var, raising=False)
+
+    @pytest.mark.usefixtures("no_api_keys")
     async def test_missing_api_key_captured_in_parallel(self, project_root: Path):
         """Should capture auth errors in parallel run result."""
-        # Temporarily unset keys
-        original_keys = {
-            "ANTHROPIC_API_KEY": os.environ.pop("ANTHROPIC_API_KEY", None),
-            "GOOGLE_API_KEY": os.environ.pop("GOOGLE_API_KEY", None),
-            "OPENAI_API_KEY": os.environ.pop("OPENAI_API_KEY", None),
-        }
+        agent = DrafterAgent(project_root=project_root)
+        result = await agent.run_parallel(
+            inputs=DrafterInput(
+                topic="Test",
+                document_type="article",
+                section_outline="Test outline",
+            ),
+        )
 
-        try:
-            agent = DrafterAgent(project_root=project_root)
-            result = await agent.run_parallel(
-                inputs=DrafterInput(
-                    topic="Test",
-                    document_type="article",
-                    section_outline="Test outline",
-                ),
-            )
+        # All should fail due to missing keys
+        assert len(result.failed) == 3
+        assert result.success_count == 0
 
-            # All should fail due to missing keys
-            assert len(result.failed) == 3
-            assert result.success_count == 0
+        for _provider, error in result.failed.items():
+            assert "AuthenticationError" in error.error_type or "not found" in error.message
 
-            for _provider, error in result.failed.items():
-                assert "AuthenticationError" in error.error_type or "not found" in error.message
+    @pytest.mark.usefixtures("no_api_keys")
+    async def test_quorum_does_not_wait_when_unreachable(self, project_root: Path):
+        """Should return all failures when the quorum can never be met."""
+        agent = DrafterAgent(project_root=project_root)
+        result = await agent.run_parallel(
+            inputs=DrafterInput(
+                topic="Test",
+                document_type="article",
+                section_outline="Test outline",
+            ),
+            quorum=2,
+            straggler_timeout=30,
+        )
 
-        finally:
-            # Restore keys
-            for key, value in original_keys.items():
-                if value:
-                    os.environ[key] = value
+        assert len(result.failed) == 3
+        assert result.success_count == 0
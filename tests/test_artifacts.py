@@ -3,9 +3,11 @@ Tests for artifact storage.
 """
 
 import json
-import tempfile
+import shutil
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -129,46 +131,116 @@ class TestProviderMapping:
 class TestObfuscation:
     """Tests for text obfuscation."""
 
-    def test_obfuscate_lowercase(self) -> None:
-        """Test lowercase provider name replacement."""
-        mapping = ProviderMapping(aleph="claude", bet="gemini", gimel="chatgpt")
-        text = "The claude draft was better than gemini."
-        result = obfuscate_provider_in_text(text, mapping)
+    @pytest.fixture(scope="module")
+    def obfuscation_mapping(self) -> ProviderMapping:
+        """Create the mapping shared by the replacement tests."""
+        return ProviderMapping(aleph="claude", bet="gemini", gimel="chatgpt")
+
+    @pytest.mark.parametrize(
+        ("text", "replace", "absent", "present"),
+        [
+            pytest.param(
+                "The claude draft was better than gemini.",
+                obfuscate_provider_in_text,
+                ["claude"],
+                ["aleph", "bet"],
+                id="obfuscate-lowercase",
+            ),
+            pytest.param(
+                "Claude produced the best draft.",
+                obfuscate_provider_in_text,
+                ["Claude"],
+                ["Aleph"],
+                id="obfuscate-titlecase",
+            ),
+            pytest.param(
+                "The aleph draft was superior to bet.",
+                reveal_provider_in_text,
+                ["aleph"],
+                ["claude", "gemini"],
+                id="reveal",
+            ),
+        ],
+    )
+    def test_replacement(
+        self,
+        obfuscation_mapping: ProviderMapping,
+        text: str,
+        replace: Callable[[str, ProviderMapping], str],
+        absent: list[str],
+        present: list[str],
+    ) -> None:
+        """Test provider names and aliases are swapped in text."""
+        result = replace(text, obfuscation_mapping)
 
-        assert "claude" not in result
-        assert "aleph" in result
-        assert "bet" in result
+        for name in absent:
+            assert name not in result
+        for name in present:
+            assert name in result
 
-    def test_obfuscate_titlecase(self) -> None:
-        """Test titlecase provider name replacement."""
-        mapping = ProviderMapping(aleph="claude", bet="gemini", gimel="chatgpt")
-        text = "Claude produced the best draft."
-        result = obfuscate_provider_in_text(text, mapping)
+    def test_round_trip_all_case_variants(self) -> None:
+        """Test every case variant survives obfuscate then reveal."""
+        mapping = ProviderMapping(aleph="gemini", bet="chatgpt", gimel="claude")
+        text = "claude, Claude, CLAUDE; gemini, Gemini, GEMINI; chatgpt, Chatgpt, CHATGPT."
+        obfuscated = obfuscate_provider_in_text(text, mapping)
 
-        assert "Claude" not in result
-        assert "Aleph" in result
+        assert obfuscated == "gimel, Gimel, GIMEL; aleph, Aleph, ALEPH; bet, Bet, BET."
+        assert reveal_provider_in_text(obfuscated, mapping) == text
 
-    def test_reveal(self) -> None:
-        """Test revealing obfuscated text."""
-        mapping = ProviderMapping(aleph="claude", bet="gemini", gimel="chatgpt")
-        text = "The aleph draft was superior to bet."
-        result = reveal_provider_in_text(text, mapping)
 
-        assert "aleph" not in result
-        assert "claude" in result
-        assert "gemini" in result
+# Output dir for tests that never touch the filesystem (nothing is created there)
+UNUSED_OUTPUT_DIR = Path("unused-output-dir")
+
+
+def _read_json(path: Path) -> Any:
+    # json.loads takes the raw UTF-8 bytes, skipping a separate decode step
+    return json.loads(path.read_bytes())
+
+
+def _make_score(score: float, explanation: str) -> ScoreExplanation:
+    return ScoreExplanation(score=score, explanation=explanation)
+
+
+def _make_detailed_score() -> DetailedScore:
+    return DetailedScore(
+        argument_strength=_make_score(8.5, "Strong"),
+        citation_quality=_make_score(8.0, "Good"),
+        prose_clarity=_make_score(9.0, "Excellent"),
+        structural_coherence=_make_score(8.5, "Well-organized"),
+        academic_rigor=_make_score(8.0, "Solid"),
+        originality=_make_score(7.5, "Adequate"),
+    )
+
+
+@pytest.fixture(scope="session")
+def _initialized_store_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Initialize one run directory per session for tests to clone."""
+    output_dir = tmp_path_factory.mktemp("store-template")
+    return ArtifactStore(output_dir=output_dir, topic="template").initialize().run_dir
 
 
 class TestArtifactStore:
     """Tests for ArtifactStore."""
 
     @pytest.fixture
-    def temp_dir(self) -> Path:
+    def temp_dir(self, tmp_path: Path) -> Path:
         """Create a temporary directory for tests."""
-        with tempfile.TemporaryDirectory() as td:
-            yield Path(td)
+        return tmp_path
 
     @pytest.fixture
+    def make_store(
+        self, temp_dir: Path, _initialized_store_template: Path
+    ) -> Callable[..., ArtifactStore]:
+        """Build stores whose run directory is cloned from the session template."""
+
+        def make(topic: str, mapping: ProviderMapping | None = None) -> ArtifactStore:
+            store = ArtifactStore(output_dir=temp_dir, topic=topic, mapping=mapping)
+            shutil.copytree(_initialized_store_template, store.run_dir, dirs_exist_ok=True)
+            return store
+
+        return make
+
+    @pytest.fixture(scope="module")
     def sample_drafter_input(self) -> DrafterInput:
         """Create sample drafter input."""
         return DrafterInput(
@@ -179,7 +251,7 @@ class TestArtifactStore:
             audience="Legal academics",
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_draft_result(self) -> DraftResult:
         """Create sample draft result."""
         return DraftResult(
@@ -199,7 +271,7 @@ class TestArtifactStore:
             metadata=AgentMetadata(model="claude-3-opus", provider="claude"),
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_edit_result(self) -> EditResult:
         """Create sample edit result."""
         return EditResult(
@@ -225,23 +297,10 @@ class TestArtifactStore:
             metadata=AgentMetadata(model="claude-3-opus", provider="claude"),
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_judge_result(self) -> JudgeResult:
         """Create sample judge result."""
-
-        def make_score(s: float, e: str) -> ScoreExplanation:
-            return ScoreExplanation(score=s, explanation=e)
-
-        def make_detailed_score() -> DetailedScore:
-            return DetailedScore(
-                argument_strength=make_score(8.5, "Strong"),
-                citation_quality=make_score(8.0, "Good"),
-                prose_clarity=make_score(9.0, "Excellent"),
-                structural_coherence=make_score(8.5, "Well-organized"),
-                academic_rigor=make_score(8.0, "Solid"),
-                originality=make_score(7.5, "Adequate"),
-            )
-
+        detailed_score = _make_detailed_score()
         return JudgeResult(
             rankings=Rankings(
                 first_place=RankingEntry(
@@ -255,9 +314,9 @@ class TestArtifactStore:
                 ),
             ),
             detailed_scores=DetailedScores(
-                claude_edit=make_detailed_score(),
-                gemini_edit=make_detailed_score(),
-                chatgpt_edit=make_detailed_score(),
+                claude_edit=detailed_score,
+                gemini_edit=detailed_score,
+                chatgpt_edit=detailed_score,
             ),
             comparative_analysis=ComparativeAnalysis(
                 strongest_arguments="Claude had the strongest arguments",
@@ -288,23 +347,22 @@ class TestArtifactStore:
         assert (store.run_dir / "judgments").exists()
         assert (store.run_dir / "final").exists()
 
-    def test_run_id_format(self, temp_dir: Path) -> None:
+    def test_run_id_format(self) -> None:
         """Test run ID format includes datetime and topic slug."""
         dt = datetime(2024, 3, 15, 14, 30)
         store = ArtifactStore(
-            output_dir=temp_dir,
+            output_dir=UNUSED_OUTPUT_DIR,
             topic="Contract Law Basics",
             started_at=dt,
         )
 
         assert store.run_id == "24-03-15-14-30_contract-law-basics"
 
-    def test_save_input(self, temp_dir: Path, sample_drafter_input: DrafterInput) -> None:
+    def test_save_input(
+        self, make_store: Callable[..., ArtifactStore], sample_drafter_input: DrafterInput
+    ) -> None:
         """Test saving input artifacts."""
-        store = ArtifactStore(
-            output_dir=temp_dir,
-            topic=sample_drafter_input.topic,
-        ).initialize()
+        store = make_store(sample_drafter_input.topic)
 
         store.save_input(sample_drafter_input)
 
@@ -318,17 +376,13 @@ class TestArtifactStore:
 
     def test_save_drafts_obfuscated(
         self,
-        temp_dir: Path,
+        make_store: Callable[..., ArtifactStore],
         sample_drafter_input: DrafterInput,
         sample_draft_result: DraftResult,
     ) -> None:
         """Test draft saving with obfuscated names."""
         mapping = ProviderMapping(aleph="claude", bet="gemini", gimel="chatgpt")
-        store = ArtifactStore(
-            output_dir=temp_dir,
-            topic=sample_drafter_input.topic,
-            mapping=mapping,
-        ).initialize()
+        store = make_store(sample_drafter_input.topic, mapping)
 
         drafts = {"claude": sample_draft_result}
         store.save_drafts(drafts)
@@ -338,22 +392,18 @@ class TestArtifactStore:
 
         # Check research notes
         assert (store.run_dir / "drafts" / "research-notes.json").exists()
-        notes = json.loads((store.run_dir / "drafts" / "research-notes.json").read_text())
+        notes = _read_json(store.run_dir / "drafts" / "research-notes.json")
         assert "aleph" in notes
 
     def test_save_edits_obfuscated(
         self,
-        temp_dir: Path,
+        make_store: Callable[..., ArtifactStore],
         sample_drafter_input: DrafterInput,
         sample_edit_result: EditResult,
     ) -> None:
         """Test edit saving with obfuscated names."""
         mapping = ProviderMapping(aleph="claude", bet="gemini", gimel="chatgpt")
-        store = ArtifactStore(
-            output_dir=temp_dir,
-            topic=sample_drafter_input.topic,
-            mapping=mapping,
-        ).initialize()
+        store = make_store(sample_drafter_input.topic, mapping)
 
         edits = {"claude": sample_edit_result}
         store.save_edits(edits)
@@ -364,24 +414,20 @@ class TestArtifactStore:
         # Check integration notes use aliases
         notes_path = store.run_dir / "edits" / "integration-notes.json"
         assert notes_path.exists()
-        notes = json.loads(notes_path.read_text())
+        notes = _read_json(notes_path)
         assert "aleph" in notes
         # Should use aliases for element sources
         assert "aleph" in notes["aleph"]["elements_from"]
 
     def test_save_judgments_obfuscated(
         self,
-        temp_dir: Path,
+        make_store: Callable[..., ArtifactStore],
         sample_drafter_input: DrafterInput,
         sample_judge_result: JudgeResult,
     ) -> None:
         """Test judgment saving with obfuscated names."""
         mapping = ProviderMapping(aleph="claude", bet="gemini", gimel="chatgpt")
-        store = ArtifactStore(
-            output_dir=temp_dir,
-            topic=sample_drafter_input.topic,
-            mapping=mapping,
-        ).initialize()
+        store = make_store(sample_drafter_input.topic, mapping)
 
         judgments = {"claude": sample_judge_result}
         consensus = ["claude", "gemini", "chatgpt"]
@@ -399,17 +445,13 @@ class TestArtifactStore:
 
     def test_save_final_with_reveal(
         self,
-        temp_dir: Path,
+        make_store: Callable[..., ArtifactStore],
         sample_drafter_input: DrafterInput,
         sample_edit_result: EditResult,
     ) -> None:
         """Test final output saving with provider reveal."""
         mapping = ProviderMapping(aleph="claude", bet="gemini", gimel="chatgpt")
-        store = ArtifactStore(
-            output_dir=temp_dir,
-            topic=sample_drafter_input.topic,
-            mapping=mapping,
-        ).initialize()
+        store = make_store(sample_drafter_input.topic, mapping)
 
         consensus = ["claude", "gemini", "chatgpt"]
         store.save_final(sample_edit_result, consensus)
@@ -428,13 +470,10 @@ class TestArtifactStore:
         assert "Chatgpt" in reveal_content
 
     def test_finalize_writes_manifest(
-        self, temp_dir: Path, sample_drafter_input: DrafterInput
+        self, make_store: Callable[..., ArtifactStore], sample_drafter_input: DrafterInput
     ) -> None:
         """Test finalize writes manifest.json."""
-        store = ArtifactStore(
-            output_dir=temp_dir,
-            topic=sample_drafter_input.topic,
-        ).initialize()
+        store = make_store(sample_drafter_input.topic)
 
         result_path = store.finalize(execution_time_ms=1234.5)
 
@@ -443,7 +482,7 @@ class TestArtifactStore:
         assert manifest_path.exists()
 
         # Check manifest content
-        manifest = json.loads(manifest_path.read_text())
+        manifest = _read_json(manifest_path)
         assert manifest["run_id"] == store.run_id
         assert manifest["execution_time_ms"] == 1234.5
         assert "provider_mapping" in manifest
@@ -452,13 +491,10 @@ class TestArtifactStore:
         assert result_path == store.run_dir
 
     def test_delete_removes_directory(
-        self, temp_dir: Path, sample_drafter_input: DrafterInput
+        self, make_store: Callable[..., ArtifactStore], sample_drafter_input: DrafterInput
     ) -> None:
         """Test delete removes the run directory."""
-        store = ArtifactStore(
-            output_dir=temp_dir,
-            topic=sample_drafter_input.topic,
-        ).initialize()
+        store = make_store(sample_drafter_input.topic)
 
         run_dir = store.run_dir
         assert run_dir.exists()
@@ -466,10 +502,10 @@ class TestArtifactStore:
         store.delete()
         assert not run_dir.exists()
 
-    def test_path_property(self, temp_dir: Path, sample_drafter_input: DrafterInput) -> None:
+    def test_path_property(self, sample_drafter_input: DrafterInput) -> None:
         """Test path property returns run directory."""
         store = ArtifactStore(
-            output_dir=temp_dir,
+            output_dir=UNUSED_OUTPUT_DIR,
             topic=sample_drafter_input.topic,
         )
 
@@ -0,0 +1,95 @@
+"""
+Tests for LLM response and source document caching.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from write_assist.caching import LLMCache, SourceCache
+
+
+class TestLLMCache:
+    """Tests for LLMCache."""
+
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        """Create a cache in a temporary directory."""
+        monkeypatch.delenv("WRITE_ASSIST_NO_CACHE", raising=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            llm_cache = LLMCache(cache_dir=Path(tmpdir), memory_items=2)
+            yield llm_cache
+            llm_cache.close()
+
+    def test_make_key_is_deterministic(self, cache: LLMCache) -> None:
+        """Test identical parameters produce identical keys."""
+        params = {
+            "provider": "claude",
+            "model": "test-model",
+            "prompt": "Hello",
+            "system_message": "System",
+            "temperature": 0.7,
+            "max_tokens": 100,
+        }
+        assert cache.make_key(**params) == cache.make_key(**params)
+        assert cache.make_key(**params) != cache.make_key(**{**params, "prompt": "Hi"})
+        # Moving text between the system message and the prompt changes the key
+        shifted = {**params, "prompt": "mHello", "system_message": "Syste"}
+        assert cache.make_key(**params) != cache.make_key(**shifted)
+
+    def test_set_and_get(self, cache: LLMCache) -> None:
+        """Test a stored response is returned."""
+        cache.set("key", '{"ok": true}')
+        assert cache.get("key") == '{"ok": true}'
+        assert cache.get("missing") is None
+
+    def test_memory_tier_evicts_but_disk_keeps(self, cache: LLMCache) -> None:
+        """Test LRU eviction from memory falls back to the disk cache."""
+        for i in range(3):
+            cache.set(f"key{i}", f"response{i}")
+
+        assert cache.stats()["memory_count"] == 2
+        assert cache.stats()["count"] == 3
+        assert cache.get("key0") == "response0"
+
+    def test_disabled_cache(self, cache: LLMCache, monkeypatch) -> None:
+        """Test WRITE_ASSIST_NO_CACHE bypasses both tiers."""
+        cache.set("key", "response")
+        monkeypatch.setenv("WRITE_ASSIST_NO_CACHE", "1")
+        assert cache.get("key") is None
+
+    def test_clear(self, cache: LLMCache) -> None:
+        """Test clear empties both tiers."""
+        cache.set("key", "response")
+        assert cache.clear() == 1
+        assert cache.get("key") is None
+
+
+class TestSourceCache:
+    """Tests for SourceCache."""
+
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        """Create a cache in a temporary directory."""
+        monkeypatch.delenv("WRITE_ASSIST_NO_CACHE", raising=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_cache = SourceCache(cache_dir=Path(tmpdir))
+            yield source_cache
+            source_cache.close()
+
+    def test_make_key_tracks_file_identity(self, cache: SourceCache) -> None:
+        """Test a modified file (new mtime or size) gets a new key."""
+        key = cache.make_key(Path("/tmp/a.pdf"), "a.pdf", 1, 100)
+        assert key == cache.make_key(Path("/tmp/a.pdf"), "a.pdf", 1, 100)
+        assert key != cache.make_key(Path("/tmp/a.pdf"), "a.pdf", 2, 100)
+        assert key != cache.make_key(Path("/tmp/a.pdf"), "a.pdf", 1, 101)
+
+    def test_set_get_and_disable(self, cache: SourceCache, monkeypatch) -> None:
+        """Test stored documents round-trip unless caching is disabled."""
+        cache.set("key", '{"title": "Doc"}')
+        assert cache.get("key") == '{"title": "Doc"}'
+        assert cache.get("missing") is None
+
+        monkeypatch.setenv("WRITE_ASSIST_NO_CACHE", "1")
+        assert cache.get("key") is None
@@ -2,11 +2,15 @@
 Tests for cite-assist integration.
 """
 
+from collections.abc import AsyncIterator
+
 import pytest
+import pytest_asyncio
 
 from write_assist.citations import (
     CitationResult,
     CitationSearchRequest,
+    CitationSearchResponse,
     CiteAssistClient,
     CiteAssistUnavailable,
 )
@@ -81,35 +85,50 @@ class TestCitationModels:
         assert "THE TEST BOOK" in bluebook  # Books are capitalized
         assert "(2020)" in bluebook
 
+    def test_citation_search_response_from_json(self) -> None:
+        """Test decoding a raw API body fills in missing fields."""
+        body = b'{"results": [{"id": "abc123", "chunk_text": "Text."}, {}], "query_time_ms": 12}'
+        response = CitationSearchResponse.model_validate_json(body)
+
+        assert response.total == 2  # Falls back to len(results)
+        assert response.query_time_ms == 12
+        assert response.results[0].relevant_text == "Text."
+        assert response.results[1].title == "Unknown"
+        assert response.results[1].result_type == "chunk"
+        assert response.results[1].authors == []
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def unavailable_client() -> AsyncIterator[CiteAssistClient]:
+    """Create one test client per class, pointing to a non-existent server."""
+    # Port 1 on the IPv4 loopback refuses at once; no name lookup or IPv6 fallback
+    client = CiteAssistClient(
+        base_url="http://127.0.0.1:1",
+        library_id=5673253,
+        timeout=0.5,  # Short timeout for faster failure
+    )
+    yield client
+    await client.close()
+
 
 class TestCiteAssistClient:
     """Tests for CiteAssistClient."""
 
-    @pytest.fixture
-    def unavailable_client(self) -> CiteAssistClient:
-        """Create a test client pointing to a non-existent server."""
-        # Use a port that's definitely not running cite-assist
-        return CiteAssistClient(
-            base_url="http://localhost:59999",
-            library_id=5673253,
-            timeout=1.0,  # Short timeout for faster failure
-        )
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_search_unavailable(self, unavailable_client: CiteAssistClient) -> None:
         """Test search when cite-assist is unavailable."""
         # Without a running cite-assist server, should raise CiteAssistUnavailable
         with pytest.raises(CiteAssistUnavailable):
             await unavailable_client.search("test query")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_search_safe_fallback(self, unavailable_client: CiteAssistClient) -> None:
         """Test search_safe returns empty results on failure."""
         response = await unavailable_client.search_safe("test query")
         assert response.results == []
         assert response.total == 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_health_check_unavailable(self, unavailable_client: CiteAssistClient) -> None:
         """Test health check when cite-assist is unavailable."""
         result = await unavailable_client.health_check()
@@ -0,0 +1,21 @@
+"""
+Tests for the shared HTTP client.
+"""
+
+from write_assist.http import close_async_client, get_async_client
+
+
+class TestSharedAsyncClient:
+    """Tests for get_async_client / close_async_client."""
+
+    async def test_client_shared_within_loop(self) -> None:
+        """Test callers on one loop share a client until it is closed."""
+        client = get_async_client()
+        assert get_async_client() is client
+
+        await close_async_client()
+        assert client.is_closed
+
+        reopened = get_async_client()
+        assert reopened is not client
+        await close_async_client()
@@ -5,7 +5,10 @@ These tests make REAL API calls - no mocks.
 Requires valid API keys in environment variables.
 """
 
+import asyncio
 import os
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -23,13 +26,15 @@ def has_api_key(env_var: str) -> bool:
     return bool(os.environ.get(env_var))
 
 
+# API keys the pipeline needs, one per provider
+API_KEY_ENV_VARS = ("ANTHROPIC_API_KEY", "GOOGLE_API_KEY", "OPENAI_API_KEY")
+
+# Keys present at import; tests that unset keys can't change which tests run
+HAS_ALL_KEYS = all(has_api_key(env_var) for env_var in API_KEY_ENV_VARS)
+
 # Skip markers
 skip_no_all_keys = pytest.mark.skipif(
-    not (
-        has_api_key("ANTHROPIC_API_KEY")
-        and has_api_key("GOOGLE_API_KEY")
-        and has_api_key("OPENAI_API_KEY")
-    ),
+    not HAS_ALL_KEYS,
     reason="Not all API keys are set",
 )
 
@@ -39,9 +44,8 @@ skip_no_all_keys = pytest.mark.skipif(
 # =============================================================================
 
 
-@pytest.fixture
-def project_root() -> Path:
-    """Get the project root directory."""
+def _find_project_root() -> Path:
+    """Walk up from the tests directory to the directory holding .claude/."""
     current = Path(__file__).parent
     for parent in [current, *current.parents]:
         if (parent / ".claude").is_dir():
@@ -49,9 +53,20 @@ def project_root() -> Path:
     return current.parent
 
 
-@pytest.fixture
+# Found once; the tree doesn't move during a test run
+PROJECT_ROOT = _find_project_root()
+
+
+@pytest.fixture(scope="session")
+def project_root() -> Path:
+    """Get the project root directory."""
+    return PROJECT_ROOT
+
+
+@pytest.fixture(scope="class")
 def pipeline(project_root: Path) -> WritingPipeline:
-    """Create a pipeline instance."""
+    """Create a pipeline instance, shared by the tests in a class."""
+    # Holds no event-loop state until entered with `async with`
     return WritingPipeline(project_root=project_root)
 
 
@@ -63,13 +78,19 @@ def pipeline(project_root: Path) -> WritingPipeline:
 class TestPipelineBasics:
     """Basic tests that don't require API calls."""
 
-    def test_pipeline_init(self, project_root: Path):
+    def test_pipeline_init(self, pipeline: WritingPipeline):
         """Should initialize pipeline with agents."""
-        pipeline = WritingPipeline(project_root=project_root)
         assert pipeline.drafter is not None
         assert pipeline.editor is not None
         assert pipeline.judge is not None
 
+    async def test_context_manager_shares_cite_assist_client(self, project_root: Path):
+        """Should hold one cite-assist client while open and close it on exit."""
+        async with WritingPipeline(project_root=project_root) as pipeline:
+            assert pipeline._cite_client is not None
+
+        assert pipeline._cite_client is None
+
     def test_phase_result_properties(self):
         """Should calculate phase result properties correctly."""
         result = PhaseResult(
@@ -108,6 +129,57 @@ class TestPipelineBasics:
         assert progress.status == "running"
         assert progress.provider == "claude"
 
+    async def test_progress_reporter_delivers_sync_and_async(self):
+        """Should defer sync and async callbacks, in order, and flush both on drain."""
+        from write_assist.pipeline.pipeline import _ProgressReporter
+
+        sync_received: list[str] = []
+        async_received: list[str] = []
+
+        async def async_callback(progress: PipelineProgress) -> None:
+            async_received.append(progress.phase)
+
+        sync_reporter = _ProgressReporter(lambda p: sync_received.append(p.phase))
+        async_reporter = _ProgressReporter(async_callback)
+
+        for phase in ("drafting", "editing", "judging"):
+            sync_reporter(PipelineProgress(phase=phase, status="starting"))
+            async_reporter(PipelineProgress(phase=phase, status="starting"))
+        assert sync_received == async_received == []
+
+        await sync_reporter.drain()
+        await async_reporter.drain()
+        assert sync_received == async_received == ["drafting", "editing", "judging"]
+
+    async def test_progress_reporter_keeps_blocking_sync_callback_off_the_loop(self):
+        """Should run sync callbacks on a thread so blocking ones don't stall the loop."""
+        from write_assist.pipeline.pipeline import _ProgressReporter
+
+        released = threading.Event()
+        reporter = _ProgressReporter(lambda _: released.wait(timeout=5))
+
+        reporter(PipelineProgress(phase="drafting", status="starting"))
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        # A callback holding the loop would keep this sleep waiting for its 5s timeout
+        assert time.perf_counter() - start < 1
+
+        released.set()
+        await reporter.drain()
+
+    def test_rank_by_score_orders_and_keeps_ties(self):
+        """Should rank highest score first, ties in first-seen order."""
+        assert WritingPipeline._rank_by_score({"claude": 4, "gemini": 9, "chatgpt": 5}) == [
+            "gemini",
+            "chatgpt",
+            "claude",
+        ]
+        assert WritingPipeline._rank_by_score({"chatgpt": 6, "claude": 6, "gemini": 6}) == [
+            "chatgpt",
+            "claude",
+            "gemini",
+        ]
+
 
 # =============================================================================
 # Pipeline Integration Tests
@@ -199,31 +271,53 @@ class TestPipelineIntegration:
 class TestPipelineErrorHandling:
     """Tests for error handling in pipeline."""
 
+    @pytest.fixture
+    def no_api_keys(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Unset every provider key for one test; pytest restores them afterwards."""
+        for env_var in API_KEY_ENV_VARS:
+            monkeypatch.delenv(env_var, raising=False)
+
+    @pytest.mark.usefixtures("no_api_keys")
     async def test_pipeline_with_no_keys(self, project_root: Path):
         """Should handle missing API keys gracefully."""
-        # Temporarily unset all keys
-        original_keys = {
-            "ANTHROPIC_API_KEY": os.environ.pop("ANTHROPIC_API_KEY", None),
-            "GOOGLE_API_KEY": os.environ.pop("GOOGLE_API_KEY", None),
-            "OPENAI_API_KEY": os.environ.pop("OPENAI_API_KEY", None),
-        }
-
-        try:
-            pipeline = WritingPipeline(project_root=project_root)
-            result = await pipeline.run(
+        pipeline = WritingPipeline(project_root=project_root)
+        result = await pipeline.run(
+            topic="Test topic",
+            document_type="article",
+            section_outline="1. Test",
+        )
+
+        # Should return a result with all failures
+        assert isinstance(result, PipelineResult)
+        assert result.drafting_phase.success_count == 0
+        assert len(result.drafting_phase.failed) == 3
+        assert not result.has_usable_result
+
+    @pytest.mark.usefixtures("no_api_keys")
+    async def test_unwritable_output_dir_fails_before_drafting(
+        self, project_root: Path, tmp_path: Path
+    ):
+        """Should raise before any provider is called if artifacts can't be written."""
+        not_a_dir = tmp_path / "runs"
+        not_a_dir.write_text("")
+        phases: list[str] = []
+        pipeline = WritingPipeline(
+            project_root=project_root, use_cite_assist=False, output_dir=not_a_dir
+        )
+
+        with pytest.raises(OSError):
+            await pipeline.run(
                 topic="Test topic",
                 document_type="article",
                 section_outline="1. Test",
+                on_progress=lambda p: phases.append(p.phase),
             )
 
-            # Should return a result with all failures
-            assert isinstance(result, PipelineResult)
-            assert result.drafting_phase.success_count == 0
-            assert len(result.drafting_phase.failed) == 3
-            assert not result.has_usable_result
-
-        finally:
-            # Restore keys
-            for key, value in original_keys.items():
-                if value:
-                    os.environ[key] = value
+        await asyncio.sleep(0.05)  # Let queued progress updates arrive
+        assert "drafting" not in phases
+
+    @pytest.mark.usefixtures("no_api_keys")
+    async def test_create_llm_clients_skips_providers_without_keys(self, project_root: Path):
+        """Should skip providers whose client can't be created."""
+        pipeline = WritingPipeline(project_root=project_root)
+        assert pipeline.create_llm_clients() == []
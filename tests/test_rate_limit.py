@@ -0,0 +1,121 @@
+"""
+Tests for client-side provider rate limiting.
+"""
+
+import asyncio
+
+import pytest
+
+from write_assist.agents.rate_limit import (
+    PROVIDER_MAX_CONCURRENCY,
+    RateLimiter,
+    estimate_tokens,
+    get_rate_limiter,
+)
+
+
+class TestRateLimiter:
+    """Tests for the AIMD + sliding-window limiter."""
+
+    async def test_concurrency_is_bounded(self) -> None:
+        """Test no more than max_concurrency requests run at once."""
+        limiter = RateLimiter(max_concurrency=2)
+        peak = 0
+
+        async def call() -> None:
+            nonlocal peak
+            await limiter.acquire()
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+            await limiter.release()
+
+        await asyncio.gather(*[call() for _ in range(6)])
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    async def test_throttling_halves_then_recovers(self) -> None:
+        """Test multiplicative decrease on throttling and additive increase on success."""
+        limiter = RateLimiter(max_concurrency=4)
+
+        await limiter.acquire()
+        await limiter.release(throttled=True)
+        assert limiter.concurrency == 2.0
+
+        await limiter.acquire()
+        await limiter.release()
+        assert limiter.concurrency == 2.5
+
+    async def test_concurrency_never_drops_below_one(self) -> None:
+        """Test repeated throttling still admits one request."""
+        limiter = RateLimiter(max_concurrency=2)
+        for _ in range(5):
+            await limiter.acquire()
+            await limiter.release(throttled=True)
+        assert limiter.concurrency == 1.0
+
+    async def test_request_budget_delays_excess_requests(self) -> None:
+        """Test requests beyond the per-minute budget wait for the window."""
+        limiter = RateLimiter(requests_per_minute=1)
+        await limiter.acquire()
+        await limiter.release()
+
+        with_budget = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.05)
+        assert not with_budget.done()
+        with_budget.cancel()
+
+    async def test_oversized_request_admitted_when_window_empty(self) -> None:
+        """Test a request larger than the token budget is not blocked forever."""
+        limiter = RateLimiter(tokens_per_minute=100)
+        await asyncio.wait_for(limiter.acquire(estimated_tokens=500), timeout=1)
+        await limiter.release()
+
+    async def test_shared_per_provider(self) -> None:
+        """Test the registry returns one limiter per provider."""
+        assert get_rate_limiter("claude") is get_rate_limiter("claude")
+        assert get_rate_limiter("claude") is not get_rate_limiter("gemini")
+
+    async def test_per_provider_ceiling(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test each provider's ceiling, and the env override for it."""
+        monkeypatch.setenv("WRITE_ASSIST_MAX_CONCURRENCY_GEMINI", "5")
+
+        assert get_rate_limiter("claude").max_concurrency == PROVIDER_MAX_CONCURRENCY["claude"]
+        assert get_rate_limiter("gemini").max_concurrency == 5
+
+    async def test_malformed_env_limits_fall_back(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test malformed overrides are logged by name and the defaults kept."""
+        monkeypatch.setenv("WRITE_ASSIST_MAX_CONCURRENCY_CLAUDE", "four")
+        monkeypatch.setenv("WRITE_ASSIST_TPM_CLAUDE", "0")
+
+        limiter = get_rate_limiter("claude")
+
+        assert limiter.max_concurrency == PROVIDER_MAX_CONCURRENCY["claude"]
+        assert limiter.tokens_per_minute is None
+        assert "WRITE_ASSIST_MAX_CONCURRENCY_CLAUDE='four'" in caplog.text
+        assert "WRITE_ASSIST_TPM_CLAUDE='0'" in caplog.text
+
+    async def test_budgets_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test per-minute budgets are off by default and configurable per provider."""
+        monkeypatch.setenv("WRITE_ASSIST_RPM_CHATGPT", "50")
+        monkeypatch.setenv("WRITE_ASSIST_TPM_CHATGPT", "40000")
+
+        claude = get_rate_limiter("claude")
+        assert (claude.requests_per_minute, claude.tokens_per_minute) == (None, None)
+        chatgpt = get_rate_limiter("chatgpt")
+        assert (chatgpt.requests_per_minute, chatgpt.tokens_per_minute) == (50, 40000)
+
+
+class TestEstimateTokens:
+    """Tests for prompt token estimation."""
+
+    def test_scales_with_length(self) -> None:
+        """Test longer prompts estimate more tokens."""
+        short = estimate_tokens("The doctrine of consideration.")
+        long = estimate_tokens("The doctrine of consideration. " * 100)
+        assert 0 < short < long
+
+    def test_counts_message_overhead(self) -> None:
+        """Test each message adds framing overhead."""
+        assert estimate_tokens("", "") > estimate_tokens("")
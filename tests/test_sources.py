@@ -2,7 +2,7 @@
 Tests for source document loading.
 """
 
-import tempfile
+from pathlib import Path
 
 import pytest
 
@@ -45,33 +45,46 @@ class TestSourceDocument:
         assert len(doc.preview) == 203  # 200 + "..."
         assert doc.preview.endswith("...")
 
+    def test_count_words_matches_split(self) -> None:
+        """Test word counting agrees with str.split on whitespace runs."""
+        from write_assist.sources.models import count_words
+
+        for text in ["", "one", "  two  words ", "tabs\tand\nnew\r\nlines"]:
+            assert count_words(text) == len(text.split())
+
+    def test_count_words_across_chunk_boundaries(self) -> None:
+        """Test words split between chunks are counted once."""
+        from write_assist.sources.models import count_words
+
+        text = " alpha  beta\tgamma delta\n epsilon "
+        for chunk_chars in range(1, len(text) + 2):
+            assert count_words(text, chunk_chars) == len(text.split())
+
 
 class TestLocalFileLoading:
     """Tests for local file loading."""
 
-    def test_load_text_file(self) -> None:
+    def test_load_text_file(self, tmp_path: Path) -> None:
         """Test loading a text file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("Hello, world!")
-            f.flush()
+        path = tmp_path / "hello.txt"
+        path.write_text("Hello, world!")
 
-            doc = load_local_file(f.name)
+        doc = load_local_file(str(path))
 
-            assert doc.source_type == SourceType.LOCAL_FILE
-            assert doc.content == "Hello, world!"
-            assert doc.word_count == 2
+        assert doc.source_type == SourceType.LOCAL_FILE
+        assert doc.content == "Hello, world!"
+        assert doc.word_count == 2
 
-    def test_load_markdown_file(self) -> None:
+    def test_load_markdown_file(self, tmp_path: Path) -> None:
         """Test loading a markdown file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write("# Title\n\nSome content here.")
-            f.flush()
+        path = tmp_path / "notes.md"
+        path.write_text("# Title\n\nSome content here.")
 
-            doc = load_local_file(f.name)
+        doc = load_local_file(str(path))
 
-            assert doc.source_type == SourceType.LOCAL_FILE
-            assert "# Title" in doc.content
-            assert doc.metadata["extension"] == ".md"
+        assert doc.source_type == SourceType.LOCAL_FILE
+        assert "# Title" in doc.content
+        assert doc.metadata["extension"] == ".md"
 
     def test_load_nonexistent_file(self) -> None:
         """Test error on nonexistent file."""
@@ -80,6 +93,21 @@ class TestLocalFileLoading:
 
         assert "not found" in str(exc_info.value).lower()
 
+    def test_load_reuses_parsed_file_until_modified(self, tmp_path: Path) -> None:
+        """Test cached loads return copies and pick up file changes."""
+        path = tmp_path / "cached.txt"
+        path.write_text("First version")
+
+        first = load_local_file(str(path))
+        first.metadata["mutated"] = True
+        second = load_local_file(str(path))
+        assert second.content == "First version"
+        assert "mutated" not in second.metadata
+
+        path.write_text("Second, longer version")
+
+        assert load_local_file(str(path)).content == "Second, longer version"
+
     def test_is_local_path(self) -> None:
         """Test local path detection."""
         assert is_local_path("/path/to/file.txt")
@@ -137,16 +165,15 @@ class TestSourceLoader:
         url = "https://docs.google.com/document/d/abc123/edit"
         assert SourceLoader.detect_type(url) == SourceType.GOOGLE_DOC
 
-    def test_load_local_file(self) -> None:
+    def test_load_local_file(self, tmp_path: Path) -> None:
         """Test loading local file through loader."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("Test content")
-            f.flush()
+        path = tmp_path / "test.txt"
+        path.write_text("Test content")
 
-            loader = SourceLoader()
-            doc = loader.load(f.name)
+        loader = SourceLoader()
+        doc = loader.load(str(path))
 
-            assert doc.content == "Test content"
+        assert doc.content == "Test content"
 
     def test_load_safe_returns_none(self) -> None:
         """Test load_safe returns None on error."""
@@ -154,18 +181,42 @@ class TestSourceLoader:
         result = loader.load_safe("/nonexistent/file.txt")
         assert result is None
 
-    def test_load_many_with_errors(self) -> None:
+    def test_load_many_with_errors(self, tmp_path: Path) -> None:
         """Test load_many continues on errors with warn mode."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("Good content")
-            f.flush()
+        path = tmp_path / "good.txt"
+        path.write_text("Good content")
 
-            loader = SourceLoader(on_error="warn")
-            docs = loader.load_many([f.name, "/nonexistent.txt"])
+        loader = SourceLoader(on_error="warn")
+        docs = loader.load_many([str(path), str(tmp_path / "missing.txt")])
 
-            # Should only load the valid file
-            assert len(docs) == 1
-            assert docs[0].content == "Good content"
+        # Should only load the valid file
+        assert len(docs) == 1
+        assert docs[0].content == "Good content"
+
+    def test_load_many_preserves_order(self, tmp_path: Path) -> None:
+        """Test threaded load_many returns documents in input order."""
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"source_{i}.txt"
+            path.write_text(f"Content {i}")
+            paths.append(str(path))
+
+        docs = SourceLoader().load_many(paths)
+
+        assert [doc.content for doc in docs] == [f"Content {i}" for i in range(4)]
+
+    async def test_load_many_async_preserves_order(self, tmp_path: Path) -> None:
+        """Test load_many_async returns documents in input order, skipping failures."""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"source_{i}.txt"
+            path.write_text(f"Content {i}")
+            paths.append(str(path))
+
+        loader = SourceLoader(on_error="skip")
+        docs = await loader.load_many_async([paths[0], "/nonexistent.txt", *paths[1:]])
+
+        assert [doc.content for doc in docs] == ["Content 0", "Content 1", "Content 2"]
 
 
 class TestGoogleDocsLoading:
@@ -180,3 +231,17 @@ class TestGoogleDocsLoading:
         # - SourceLoadError (if credentials exist but doc doesn't)
         with pytest.raises((GoogleDocsUnavailable, SourceLoadError)):
             load_google_doc("https://docs.google.com/document/d/fake-doc-id-12345/edit")
+
+    def test_batch_load_reports_each_doc(self) -> None:
+        """Test batched Google Docs loading applies on_error to each URL."""
+        loader = SourceLoader(on_error="skip")
+        progress: list[tuple[str, bool]] = []
+        urls = [
+            "https://docs.google.com/document/d/fake-doc-id-1/edit",
+            "https://docs.google.com/document/d/fake-doc-id-2/edit",
+        ]
+
+        docs = loader.load_many(urls, on_progress=lambda path, ok: progress.append((path, ok)))
+
+        assert docs == []
+        assert sorted(progress) == [(url, False) for url in urls]